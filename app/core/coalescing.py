@@ -0,0 +1,94 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class SingleFlight(Generic[K, V]):
+    """Chamadas concorrentes com a mesma chave compartilham uma única execução"""
+
+    def __init__(self):
+        self._in_flight: dict[K, asyncio.Task[V]] = {}
+        self.calls = 0
+        self.executions = 0
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # O cancelamento de um chamador não cancela a execução dos demais
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {
+            'in_flight': len(self._in_flight),
+            'calls': self.calls,
+            'executions': self.executions,
+            'coalesced': self.calls - self.executions,
+        }
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Agrupa as chaves pedidas dentro de uma janela de ``window`` segundos em
+    uma única chamada de ``batch_fn``, no estilo do DataLoader.
+
+    ``batch_fn`` recebe a lista de chaves e devolve um dict chave -> valor;
+    chaves ausentes do dict resolvem para None.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], Awaitable[dict[K, V]]],
+        window: float,
+        max_batch_size: int = 100,
+    ):
+        self.batch_fn = batch_fn
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._pending: dict[K, asyncio.Future[V | None]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task] = set()
+        self.loads = 0
+        self.batches = 0
+
+    async def load(self, key: K) -> V | None:
+        self.loads += 1
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._dispatch)
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        self.batches += 1
+        task = asyncio.ensure_future(self._resolve(pending))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _resolve(self, pending: dict[K, asyncio.Future[V | None]]) -> None:
+        try:
+            values = await self.batch_fn(list(pending))
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, future in pending.items():
+            if not future.done():
+                future.set_result(values.get(key))
@@ -0,0 +1,26 @@
+import hashlib
+
+from app.models.user import User
+from app.types.schemas import UserResponse
+
+
+def user_etag(user: User) -> str:
+    """
+    ETag forte, calculado a partir do corpo da resposta e do token_version.
+    O updated_at tem precisão de segundos, então sozinho não detecta duas
+    escritas no mesmo segundo.
+    """
+    body = UserResponse.model_validate(user).model_dump_json()
+    version = f'{user.token_version}:{body}'
+    return f'"{hashlib.sha256(version.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    # If-None-Match usa comparação fraca (RFC 9110, seção 13.1.2)
+    return any(
+        tag.strip().removeprefix('W/') == etag for tag in if_none_match.split(',')
+    )
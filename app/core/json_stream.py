@@ -0,0 +1,81 @@
+import codecs
+import json
+from typing import Any, AsyncIterator
+
+from app.types.exceptions import InvalidPayloadError
+
+SEPARATORS = ' \t\r\n,'
+
+
+class JSONRowParser:
+    """Incremental parser for NDJSON bodies or a top-level JSON array."""
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._is_array: bool | None = None
+        self._closed = False
+
+    def feed(self, text: str) -> list[Any]:
+        self._buffer += text
+        if self._is_array is None:
+            self._buffer = self._buffer.lstrip()
+            if not self._buffer:
+                return []
+            self._is_array = self._buffer[0] == '['
+            if self._is_array:
+                self._buffer = self._buffer[1:]
+        if self._is_array:
+            return self._drain_array()
+        *lines, self._buffer = self._buffer.split('\n')
+        return [self._load_line(line) for line in lines if line.strip()]
+
+    def close(self) -> list[Any]:
+        if not self._is_array:
+            rest, self._buffer = self._buffer, ''
+            return [self._load_line(rest)] if rest.strip() else []
+        rows = self._drain_array()
+        if not self._closed or self._buffer.strip():
+            raise InvalidPayloadError('Malformed JSON array.')
+        return rows
+
+    def _drain_array(self) -> list[Any]:
+        rows = []
+        buffer, index = self._buffer, 0
+        while not self._closed:
+            while index < len(buffer) and buffer[index] in SEPARATORS:
+                index += 1
+            if index == len(buffer):
+                break
+            if buffer[index] == ']':
+                self._closed = True
+                index += 1
+                break
+            try:
+                row, index = self._decoder.raw_decode(buffer, index)
+            except json.JSONDecodeError:
+                break
+            rows.append(row)
+        self._buffer = buffer[index:]
+        return rows
+
+    @staticmethod
+    def _load_line(line: str) -> Any:
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError as e:
+            return e
+
+
+async def iter_json_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """
+    Yield the rows of a request body as they arrive. Malformed NDJSON lines are
+    yielded as their ``JSONDecodeError`` so callers can report them per row.
+    """
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    parser = JSONRowParser()
+    async for chunk in chunks:
+        for row in parser.feed(text_decoder.decode(chunk)):
+            yield row
+    for row in parser.feed(text_decoder.decode(b'', final=True)) + parser.close():
+        yield row
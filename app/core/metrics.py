@@ -0,0 +1,58 @@
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Com vários workers do uvicorn, cada processo grava suas métricas em
+# PROMETHEUS_MULTIPROC_DIR e o endpoint agrega os arquivos de todos eles
+MULTIPROCESS = 'PROMETHEUS_MULTIPROC_DIR' in os.environ
+
+http_requests = Counter(
+    'http_requests_total',
+    'HTTP requests by route template and status code.',
+    ['method', 'route', 'status'],
+)
+http_request_duration = Histogram(
+    'http_request_duration_seconds',
+    'HTTP request latency by route template and status code.',
+    ['method', 'route', 'status'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+http_requests_in_flight = Gauge(
+    'http_requests_in_flight',
+    'HTTP requests currently being processed.',
+    ['method'],
+    multiprocess_mode='livesum',
+)
+api_exceptions = Counter(
+    'api_exceptions_total',
+    'Handled API exceptions by exception class.',
+    ['exception'],
+)
+login_throttled = Counter(
+    'login_throttled_total',
+    'Login attempts rejected before password verification, by reason.',
+    ['reason'],
+)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
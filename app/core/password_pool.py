@@ -0,0 +1,144 @@
+import asyncio
+import math
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from app.core.security import security
+from app.core.settings import get_settings
+from app.types.exceptions import ServiceUnavailableError
+
+
+def _execute(operation: str, *args) -> tuple:
+    started_at = time.time()
+    result = getattr(security, operation)(*args)
+    return result, started_at, time.time()
+
+
+class PasswordPool:
+    def __init__(self, max_workers: int = 0, max_queue: int = 64):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait_seconds = 0.0
+        self.execution_seconds = 0.0
+        self.max_queue_wait_seconds = 0.0
+
+    def _submit(self, operation: str, *args, admit: bool = True) -> Future:
+        with self._lock:
+            if admit and self._pending >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise ServiceUnavailableError(
+                    'Password service is overloaded, please try again later.'
+                )
+            self._pending += 1
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+            executor = self._executor
+        submitted_at = time.time()
+        try:
+            future = executor.submit(_execute, operation, *args)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(lambda f: self._record(f, submitted_at))
+        return future
+
+    def _record(self, future: Future, submitted_at: float) -> None:
+        with self._lock:
+            self._pending -= 1
+            if future.cancelled() or future.exception() is not None:
+                return
+            _, started_at, finished_at = future.result()
+            queue_wait = max(started_at - submitted_at, 0.0)
+            self.completed += 1
+            self.queue_wait_seconds += queue_wait
+            self.execution_seconds += finished_at - started_at
+            self.max_queue_wait_seconds = max(
+                self.max_queue_wait_seconds, queue_wait
+            )
+
+    def hash_password(self, password: str) -> str:
+        return self._submit('hash_password', password).result()[0]
+
+    def hash_passwords(self, passwords: list[str]) -> list[str]:
+        """
+        Hash a batch split across every worker. Batches skip admission control
+        and wait for capacity, so they shed interactive load instead of failing.
+        """
+        size = max(math.ceil(len(passwords) / self.max_workers), 1)
+        futures = [
+            self._submit('hash_passwords', passwords[i : i + size], admit=False)
+            for i in range(0, len(passwords), size)
+        ]
+        return [hashed for future in futures for hashed in future.result()[0]]
+
+    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        future = self._submit('verify_password', plain_password, hashed_password)
+        return future.result()[0]
+
+    def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        future = self._submit('verify_and_update', plain_password, hashed_password)
+        return future.result()[0]
+
+    async def ahash_password(self, password: str) -> str:
+        result, *_ = await asyncio.wrap_future(
+            self._submit('hash_password', password)
+        )
+        return result
+
+    async def averify_password(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        result, *_ = await asyncio.wrap_future(
+            self._submit('verify_password', plain_password, hashed_password)
+        )
+        return result
+
+    async def averify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        result, *_ = await asyncio.wrap_future(
+            self._submit('verify_and_update', plain_password, hashed_password)
+        )
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'workers': self.max_workers,
+                'max_queue': self.max_queue,
+                'pending': self._pending,
+                'completed': self.completed,
+                'rejected': self.rejected,
+                'avg_queue_wait_ms': self._average_ms(self.queue_wait_seconds),
+                'max_queue_wait_ms': self.max_queue_wait_seconds * 1000,
+                'avg_execution_ms': self._average_ms(self.execution_seconds),
+            }
+
+    def _average_ms(self, total_seconds: float) -> float:
+        return total_seconds * 1000 / self.completed if self.completed else 0.0
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_pool = PasswordPool(
+    max_workers=get_settings().PASSWORD_POOL_WORKERS,
+    max_queue=get_settings().PASSWORD_POOL_MAX_QUEUE,
+)
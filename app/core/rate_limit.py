@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator
+
+from app.core.metrics import login_throttled
+from app.core.settings import get_settings
+from app.interfaces.rate_limit_backend_interface import IRateLimitBackend
+from app.types.exceptions import ServiceUnavailableError, TooManyRequestsError
+
+
+class MemoryRateLimitBackend(IRateLimitBackend):
+    """Janela deslizante em memória; cada worker tem os seus contadores"""
+
+    def __init__(self):
+        self._hits: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+
+    def hit(self, key: str, limit: int, window: float) -> float | None:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_sweep >= window:
+                self._sweep(now - window)
+            hits = self._hits.setdefault(key, deque())
+            while hits and hits[0] <= now - window:
+                hits.popleft()
+            if len(hits) >= limit:
+                return hits[0] + window - now
+            hits.append(now)
+            return None
+
+    def _sweep(self, cutoff: float) -> None:
+        for key, hits in list(self._hits.items()):
+            if not hits or hits[-1] <= cutoff:
+                del self._hits[key]
+        self._last_sweep = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._hits)
+
+
+class LoginThrottle:
+    """
+    Limita as tentativas de login por IP e por email antes de qualquer
+    consulta ou verificação de senha, e o número de verificações de senha
+    simultâneas. Limites iguais a 0 ficam desligados.
+    """
+
+    def __init__(
+        self,
+        backend: IRateLimitBackend,
+        window: float,
+        per_ip: int,
+        per_email: int,
+        max_concurrent_verifications: int,
+    ):
+        self.backend = backend
+        self.window = window
+        self.limits = {'ip': per_ip, 'email': per_email}
+        self._verifications = (
+            threading.BoundedSemaphore(max_concurrent_verifications)
+            if max_concurrent_verifications > 0
+            else None
+        )
+
+    def check(self, client_ip: str | None, email: str) -> None:
+        keys = {'ip': client_ip, 'email': email.strip().lower()}
+        for reason, value in keys.items():
+            limit = self.limits[reason]
+            if limit <= 0 or not value:
+                continue
+            retry_after = self.backend.hit(
+                f'login:{reason}:{value}', limit, self.window
+            )
+            if retry_after is not None:
+                login_throttled.labels(reason).inc()
+                raise TooManyRequestsError(retry_after)
+
+    @contextmanager
+    def verification_slot(self) -> Iterator[None]:
+        if self._verifications is not None and not self._verifications.acquire(
+            blocking=False
+        ):
+            login_throttled.labels('concurrency').inc()
+            raise ServiceUnavailableError(
+                'Too many logins in progress, please try again later.'
+            )
+        try:
+            yield
+        finally:
+            if self._verifications is not None:
+                self._verifications.release()
+
+
+login_throttle = LoginThrottle(
+    backend=MemoryRateLimitBackend(),
+    window=get_settings().LOGIN_RATE_LIMIT_WINDOW,
+    per_ip=get_settings().LOGIN_RATE_LIMIT_PER_IP,
+    per_email=get_settings().LOGIN_RATE_LIMIT_PER_EMAIL,
+    max_concurrent_verifications=get_settings().LOGIN_MAX_CONCURRENT_VERIFICATIONS,
+)
@@ -0,0 +1,37 @@
+import threading
+import time
+
+from app.core.settings import get_settings
+
+
+class RevocationList:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict[str, tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def revoke(self, user_id: str, token_version: int) -> None:
+        """Reject tokens of ``user_id`` issued before ``token_version``."""
+        now = time.monotonic()
+        with self._lock:
+            for key, (_, expires_at) in list(self._entries.items()):
+                if expires_at <= now:
+                    del self._entries[key]
+            self._entries[user_id] = (token_version, now + self.ttl)
+
+    def is_revoked(self, user_id: str, token_version: int) -> bool:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return False
+            min_version, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return False
+            return token_version < min_version
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+revocation_list = RevocationList(ttl=get_settings().ACCESS_TOKEN_EXPIRE_MINUTES * 60)
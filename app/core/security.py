@@ -1,38 +1,105 @@
+import hashlib
+import secrets
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict
 
 import jwt
-from passlib.context import CryptContext
 
-from app.core.settings import Settings
+from app.core.cache import LRUCache
+from app.core.settings import Settings, get_settings
 from app.types.exceptions import ExpiredSignatureError, InvalidTokenError
 
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+
+def build_password_context(settings: Settings) -> 'CryptContext':
+    # passlib só é carregado quando um hash é gerado ou verificado
+    from passlib.context import CryptContext  # noqa: PLC0415
+
+    options = {'schemes': settings.PASSWORD_SCHEMES, 'deprecated': 'auto'}
+    if 'bcrypt' in settings.PASSWORD_SCHEMES:
+        options.update(
+            bcrypt__rounds=settings.BCRYPT_ROUNDS,
+            bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+            bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+        )
+    if 'argon2' in settings.PASSWORD_SCHEMES:
+        options.update(
+            argon2__time_cost=settings.ARGON2_TIME_COST,
+            argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+            argon2__parallelism=settings.ARGON2_PARALLELISM,
+        )
+    return CryptContext(**options)
+
 
 class SecurityManager:
     def __init__(self):
-        self.secret_key = Settings().SECRET_KEY
-        self.algorithm = Settings().ALGORITHM
-        self.pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+        self.secret_key = get_settings().SECRET_KEY
+        self.algorithm = get_settings().ALGORITHM
+        self.access_token_expire_minutes = get_settings().ACCESS_TOKEN_EXPIRE_MINUTES
+        self.token_cache = LRUCache(max_size=get_settings().TOKEN_CACHE_MAX_SIZE)
+
+    @cached_property
+    def pwd_context(self) -> 'CryptContext':
+        return build_password_context(get_settings())
 
     def hash_password(self, password: str) -> str:
         return self.pwd_context.hash(password)
 
+    def hash_passwords(self, passwords: list[str]) -> list[str]:
+        return [self.pwd_context.hash(password) for password in passwords]
+
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         return self.pwd_context.verify(plain_password, hashed_password)
 
-    def create_access_token(self, data: dict, expires_in: int = 60) -> str:
+    def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        return self.pwd_context.verify_and_update(plain_password, hashed_password)
+
+    def needs_update(self, hashed_password: str) -> bool:
+        return self.pwd_context.needs_update(hashed_password)
+
+    def create_access_token(self, data: dict, expires_in: int | None = None) -> str:
+        if expires_in is None:
+            expires_in = self.access_token_expire_minutes
         to_encode = data.copy()
         expire = datetime.now(timezone.utc) + timedelta(minutes=expires_in)
         to_encode.update({'exp': expire})
         return jwt.encode(to_encode, self.secret_key, self.algorithm)
 
+    @staticmethod
+    def create_refresh_token() -> str:
+        return secrets.token_urlsafe(32)
+
+    @staticmethod
+    def hash_refresh_token(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
     def verify_access_token(self, token: str) -> Dict:
+        cache_key = hashlib.sha256(token.encode()).digest()
+        payload = self.token_cache.get(cache_key)
+        if payload is not None:
+            if payload['exp'] <= time.time():
+                self.token_cache.invalidate(cache_key)
+                raise ExpiredSignatureError(
+                    'Token has expired. Please log in again.'
+                )
+            return dict(payload)
+
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
         except jwt.ExpiredSignatureError:
             raise ExpiredSignatureError('Token has expired. Please log in again.')
         except jwt.InvalidTokenError:
             raise InvalidTokenError()
+
+        if isinstance(payload.get('exp'), (int, float)):
+            ttl = payload['exp'] - time.time()
+            self.token_cache.set(cache_key, dict(payload), ttl=ttl)
         return payload
 
 
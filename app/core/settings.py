@@ -1,5 +1,7 @@
 import logging
 import sys
+from contextlib import contextmanager
+from typing import Any, Iterator, Literal
 
 from dotenv import load_dotenv
 from loguru import logger
@@ -13,12 +15,74 @@ class Settings(BaseSettings):
 
     DATABASE_URL: str
     DATABASE_TYPE: str
+    DATABASE_ASYNC: bool = False
+    ASYNC_DATABASE_URL: str | None = None
+    DATABASE_REPLICA_URLS: list[str] = []
+    DB_REPLICA_STRATEGY: Literal['round_robin', 'least_connections'] = 'round_robin'
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP: int = 0
+    SLOW_QUERY_MS: float = 200.0
+    QUERY_REPEAT_THRESHOLD: int = 3
+    MIGRATION_LOCK_TIMEOUT: float = 300.0
+    MIGRATION_LOCK_FILE: str | None = None
     SECRET_KEY: str
     ALGORITHM: str
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    AUTH_STATELESS: bool = False
+    AUTH_BATCH_WINDOW_MS: float = 0.0
+    LOGIN_RATE_LIMIT_WINDOW: float = 60.0
+    LOGIN_RATE_LIMIT_PER_IP: int = 20
+    LOGIN_RATE_LIMIT_PER_EMAIL: int = 5
+    LOGIN_MAX_CONCURRENT_VERIFICATIONS: int = 16
+    PASSWORD_SCHEMES: list[str] = ['bcrypt']
+    BCRYPT_ROUNDS: int = 12
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536
+    ARGON2_PARALLELISM: int = 4
+    PASSWORD_POOL_WORKERS: int = 0
+    PASSWORD_POOL_MAX_QUEUE: int = 64
+    BULK_REGISTER_CHUNK_SIZE: int = 500
+    EXPORT_BATCH_SIZE: int = 1000
+    UUID_VERSION: Literal[4, 7] = 7
     LOCAL_ENV: bool = False
     VERSION: str = '0.1.0'
     API_PREFIX: str = '/api'
     PROJECT_NAME: str = 'API_JA_5P'
+    PRINCIPAL_CACHE_TTL: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10_000
+    TOKEN_CACHE_MAX_SIZE: int = 10_000
+
+
+_cached: dict[str, Settings] = {}
+
+
+def get_settings() -> Settings:
+    """Instância única das Settings, criada no primeiro uso"""
+    settings = _cached.get('settings')
+    if settings is None:
+        settings = _cached.setdefault('settings', Settings())
+    return settings
+
+
+def reset_settings() -> None:
+    """Descarta a instância em cache; a próxima chamada relê o ambiente"""
+    _cached.pop('settings', None)
+
+
+@contextmanager
+def override_settings(**values: Any) -> Iterator[Settings]:
+    """Substitui campos das Settings dentro do bloco (usado nos testes)"""
+    previous = get_settings()
+    _cached['settings'] = previous.model_copy(update=values)
+    try:
+        yield _cached['settings']
+    finally:
+        _cached['settings'] = previous
 
 
 class InterceptHandler(logging.Handler):
@@ -28,7 +92,7 @@ class InterceptHandler(logging.Handler):
         logger_opt.log(record.levelname, record.getMessage())
 
 
-LOGGING_LEVEL = logging.DEBUG if Settings().LOCAL_ENV else logging.INFO
+LOGGING_LEVEL = logging.DEBUG if get_settings().LOCAL_ENV else logging.INFO
 logging.basicConfig(
     handlers=[InterceptHandler(level=LOGGING_LEVEL)], level=LOGGING_LEVEL
 )
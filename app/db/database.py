@@ -1,48 +1,194 @@
-from alembic import command
-from alembic.config import Config
+from contextlib import AsyncExitStack, ExitStack
+from typing import TYPE_CHECKING
+
 from loguru import logger
-from sqlalchemy import create_engine
+from sqlalchemy import Connection, create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker
 
-from app.core.settings import Settings
+from app.core.settings import get_settings
+from app.db.migration_lock import migration_lock
+from app.db.pool import PoolInstrumentation, engine_pool_options
+from app.db.profiler import instrument
+from app.db.routing import routing_options
 from app.types.exceptions import DatabaseConnectionError, MigrationExecutionError
 
-engine = create_engine(Settings().DATABASE_URL)
+if TYPE_CHECKING:
+    from alembic.config import Config
+
+engine = create_engine(
+    get_settings().DATABASE_URL, **engine_pool_options(get_settings().DATABASE_URL)
+)
+
+instrument(engine)
+
+replica_engines = [
+    create_engine(url, **engine_pool_options(url))
+    for url in get_settings().DATABASE_REPLICA_URLS
+]
+
+for replica_engine in replica_engines:
+    instrument(replica_engine)
+
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    **routing_options(replica_engines),
+)
+
+ASYNC_DRIVERS = {
+    'mysql': 'mysql+aiomysql',
+    'mysql+pymysql': 'mysql+aiomysql',
+    'sqlite': 'sqlite+aiosqlite',
+}
+
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def to_async_url(url: str) -> str:
+    url = make_url(url)
+    url = url.set(drivername=ASYNC_DRIVERS.get(url.drivername, url.drivername))
+    return url.render_as_string(hide_password=False)
+
+
+def get_async_database_url() -> str:
+    return to_async_url(
+        get_settings().ASYNC_DATABASE_URL or get_settings().DATABASE_URL
+    )
+
+
+def create_async_engines(urls: list[str]) -> list[AsyncEngine]:
+    engines = [
+        create_async_engine(url, **engine_pool_options(url, asynchronous=True))
+        for url in map(to_async_url, urls)
+    ]
+    for created in engines:
+        instrument(created.sync_engine)
+    return engines
+
+
+async_engines = (
+    create_async_engines([
+        get_async_database_url(),
+        *get_settings().DATABASE_REPLICA_URLS,
+    ])
+    if get_settings().DATABASE_ASYNC
+    else []
+)
+async_engine = async_engines[0] if async_engines else None
+async_replica_engines = async_engines[1:]
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    **routing_options(
+        [replica.sync_engine for replica in async_replica_engines],
+        asynchronous=True,
+    ),
+)
 
 
 def test_connection():
     try:
         with engine.connect():
             logger.info(
-                f'Successfully connected to {Settings().DATABASE_TYPE} database.'
+                f'Successfully connected to {get_settings().DATABASE_TYPE} database.'
             )
     except Exception:
         raise DatabaseConnectionError(
-            f'Failed to connect to {Settings().DATABASE_TYPE} database.'
+            f'Failed to connect to {get_settings().DATABASE_TYPE} database.'
         )
-    finally:
-        engine.dispose()
+
+
+def current_revision(connection: Connection) -> str | None:
+    from alembic.runtime.migration import MigrationContext  # noqa: PLC0415
+
+    revision = MigrationContext.configure(connection).get_current_revision()
+    # Encerra a transação para que a próxima leitura veja o estado atual do banco
+    connection.rollback()
+    return revision
+
+
+def head_revision(alembic_cfg: 'Config') -> str | None:
+    from alembic.script import ScriptDirectory  # noqa: PLC0415
+
+    return ScriptDirectory.from_config(alembic_cfg).get_current_head()
 
 
 def run_migrations():
+    """
+    Atualiza o banco até a head.
+
+    Com vários workers, apenas o que obtiver o lock de migrations roda o
+    upgrade; os demais esperam o lock e encontram o banco já na head.
+    """
+    # Alembic (e o Mako) só são carregados quando as migrations rodam
+    from alembic import command  # noqa: PLC0415
+    from alembic.config import Config  # noqa: PLC0415
+
     try:
         alembic_cfg = Config('alembic.ini')
+        head = head_revision(alembic_cfg)
         with engine.connect() as connection:
-            alembic_cfg.attributes['connection'] = connection
-            logger.info('Running migrations...')
-            command.upgrade(alembic_cfg, 'head')
-            logger.info('Migrations executed successfully!')
+            if current_revision(connection) == head:
+                logger.info(f'Database already at head ({head}).')
+                return
+            with migration_lock(connection):
+                if current_revision(connection) == head:
+                    logger.info('Migrations already applied by another worker.')
+                    return
+                alembic_cfg.attributes['connection'] = connection
+                logger.info('Running migrations...')
+                command.upgrade(alembic_cfg, 'head')
+                connection.commit()
+                logger.info('Migrations executed successfully!')
     except Exception as e:
         logger.error(f'Error during migrations execution: {e}')
         raise MigrationExecutionError(
             'An error occurred while executing database migrations.'
         )
-    finally:
-        engine.dispose()
+
+
+def warm_up_pool(connections: int):
+    """Abre ``connections`` conexões ao mesmo tempo e as devolve ao pool"""
+    with ExitStack() as stack:
+        for _ in range(connections):
+            stack.enter_context(engine.connect())
+    logger.info(f'Connection pool warmed up with {connections} connections.')
+
+
+async def warm_up_async_pool(connections: int):
+    async with AsyncExitStack() as stack:
+        for _ in range(connections):
+            await stack.enter_async_context(async_engine.connect())
+    logger.info(f'Async connection pool warmed up with {connections} connections.')
+
+
+def pool_stats() -> dict[str, dict]:
+    pools = {'sync': engine.pool}
+    for i, replica in enumerate(replica_engines):
+        pools[f'sync-replica-{i}'] = replica.pool
+    if async_engine is not None:
+        pools['async'] = async_engine.pool
+    for i, replica in enumerate(async_replica_engines):
+        pools[f'async-replica-{i}'] = replica.pool
+    return {
+        name: pool.stats()
+        for name, pool in pools.items()
+        if isinstance(pool, PoolInstrumentation)
+    }
 
 
 def get_session():
     with SessionLocal() as session:
         yield session
+
+
+async def get_async_session():
+    async with AsyncSessionLocal() as session:
+        yield session
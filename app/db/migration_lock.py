@@ -0,0 +1,94 @@
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+from loguru import logger
+from sqlalchemy import Connection, text
+
+from app.core.settings import get_settings
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+LOCK_NAME = 'api_ja_5p_migrations'
+POLL_INTERVAL = 0.1
+
+
+def _try_lock(handle: IO) -> None:
+    """Levanta OSError se outro processo já detém o lock"""
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    else:
+        msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+
+
+def _unlock(handle: IO) -> None:
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    else:
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def lock_file_path() -> Path:
+    path = get_settings().MIGRATION_LOCK_FILE
+    return Path(path or Path(tempfile.gettempdir()) / f'{LOCK_NAME}.lock')
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float) -> Iterator[None]:
+    """Lock exclusivo entre processos da mesma máquina"""
+    deadline = time.monotonic() + timeout
+    with path.open('a+b') as handle:
+        while True:
+            try:
+                _try_lock(handle)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f'Timed out waiting for lock file {path}')
+                time.sleep(POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            _unlock(handle)
+
+
+@contextmanager
+def advisory_lock(connection: Connection, timeout: float) -> Iterator[None]:
+    """Lock nomeado do MySQL, compartilhado por todas as máquinas"""
+    acquired = connection.execute(
+        text('SELECT GET_LOCK(:name, :timeout)'),
+        {'name': LOCK_NAME, 'timeout': timeout},
+    ).scalar()
+    if acquired != 1:
+        raise TimeoutError(f'Timed out waiting for database lock {LOCK_NAME}')
+    try:
+        yield
+    finally:
+        connection.execute(text('SELECT RELEASE_LOCK(:name)'), {'name': LOCK_NAME})
+
+
+@contextmanager
+def migration_lock(connection: Connection) -> Iterator[None]:
+    """
+    Garante que apenas um worker rode as migrations por vez.
+
+    No MySQL usa GET_LOCK, que vale para todas as instâncias conectadas ao
+    banco; nos demais bancos usa um arquivo de lock local.
+    """
+    timeout = get_settings().MIGRATION_LOCK_TIMEOUT
+    if connection.dialect.name == 'mysql':
+        lock = advisory_lock(connection, timeout)
+    else:
+        lock = file_lock(lock_file_path(), timeout)
+
+    started_at = time.perf_counter()
+    with lock:
+        waited = (time.perf_counter() - started_at) * 1000
+        logger.info(f'Migration lock acquired after {waited:.1f} ms.')
+        yield
@@ -5,12 +5,13 @@ from sqlalchemy import pool
 
 from alembic import context
 
-from app.core.settings import Settings
+from app.core.settings import get_settings
 from app.models.base_model import BaseModel
+from app.models.refresh_token import RefreshToken
 from app.models.user import User
 
 config = context.config
-config.set_main_option('sqlalchemy.url', Settings().DATABASE_URL)
+config.set_main_option('sqlalchemy.url', get_settings().DATABASE_URL)
 
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
@@ -49,6 +50,17 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    connection = config.attributes.get('connection')
+    if connection is not None:
+        # Reuse the application's pooled connection (see run_migrations)
+        context.configure(
+            connection=connection, target_metadata=target_metadata
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -0,0 +1,51 @@
+"""Store user id as binary
+
+Revision ID: c7e2a94f1b60
+Revises: 8c41e0a7b3d2
+Create Date: 2026-10-18 16:52:08.431276
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2a94f1b60'
+down_revision: Union[str, None] = '8c41e0a7b3d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('id_bin', sa.BINARY(length=16), nullable=True))
+    op.execute("UPDATE users SET id_bin = UNHEX(REPLACE(id, '-', ''))")
+    op.drop_index('ix_users_role_created_at_id', table_name='users')
+    op.drop_index('ix_users_created_at_id', table_name='users')
+    op.execute('ALTER TABLE users DROP PRIMARY KEY')
+    op.drop_column('users', 'id')
+    op.execute('ALTER TABLE users CHANGE id_bin id BINARY(16) NOT NULL FIRST')
+    op.create_primary_key('pk_users', 'users', ['id'])
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False)
+    op.create_index('ix_users_role_created_at_id', 'users', ['role', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('users', sa.Column('id_char', mysql.CHAR(length=36), nullable=True))
+    op.execute(
+        "UPDATE users SET id_char = LOWER(CONCAT_WS('-', "
+        'HEX(SUBSTR(id, 1, 4)), HEX(SUBSTR(id, 5, 2)), HEX(SUBSTR(id, 7, 2)), '
+        'HEX(SUBSTR(id, 9, 2)), HEX(SUBSTR(id, 11, 6))))'
+    )
+    op.drop_index('ix_users_role_created_at_id', table_name='users')
+    op.drop_index('ix_users_created_at_id', table_name='users')
+    op.execute('ALTER TABLE users DROP PRIMARY KEY')
+    op.drop_column('users', 'id')
+    op.execute('ALTER TABLE users CHANGE id_char id CHAR(36) NOT NULL FIRST')
+    op.create_primary_key('pk_users', 'users', ['id'])
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False)
+    op.create_index('ix_users_role_created_at_id', 'users', ['role', 'created_at', 'id'], unique=False)
@@ -0,0 +1,91 @@
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection, QueuePool
+
+from app.core.settings import get_settings
+
+
+class PoolInstrumentation:
+    """Conta checkouts, tempo de espera e timeouts de um QueuePool"""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.checkout_wait_seconds = 0.0
+        self.max_checkout_wait_seconds = 0.0
+        super().__init__(*args, **kwargs)
+
+    def connect(self) -> PoolProxiedConnection:
+        started_at = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        waited = time.perf_counter() - started_at
+        with self._stats_lock:
+            self.checkouts += 1
+            self.checkout_wait_seconds += waited
+            self.max_checkout_wait_seconds = max(
+                self.max_checkout_wait_seconds, waited
+            )
+        return connection
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                'size': self.size(),
+                'checked_out': self.checkedout(),
+                'checked_in': self.checkedin(),
+                'overflow': max(self.overflow(), 0),
+                'max_overflow': self._max_overflow,
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'avg_checkout_wait_ms': (
+                    self.checkout_wait_seconds / self.checkouts * 1000
+                    if self.checkouts
+                    else 0.0
+                ),
+                'max_checkout_wait_ms': self.max_checkout_wait_seconds * 1000,
+            }
+
+
+class InstrumentedQueuePool(PoolInstrumentation, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(PoolInstrumentation, AsyncAdaptedQueuePool):
+    pass
+
+
+def is_memory_database(url: str | URL) -> bool:
+    url = make_url(url)
+    return url.get_backend_name() == 'sqlite' and url.database in {
+        None,
+        '',
+        ':memory:',
+    }
+
+
+def engine_pool_options(url: str | URL, asynchronous: bool = False) -> dict:
+    """Parâmetros do pool para create_engine, a partir das Settings"""
+    if is_memory_database(url):
+        # O SQLite em memória usa um pool próprio, com uma conexão por thread
+        return {}
+    settings = get_settings()
+    return {
+        'poolclass': (
+            InstrumentedAsyncQueuePool if asynchronous else InstrumentedQueuePool
+        ),
+        'pool_size': settings.DB_POOL_SIZE,
+        'max_overflow': settings.DB_MAX_OVERFLOW,
+        'pool_timeout': settings.DB_POOL_TIMEOUT,
+        'pool_recycle': settings.DB_POOL_RECYCLE,
+        'pool_pre_ping': settings.DB_POOL_PRE_PING,
+    }
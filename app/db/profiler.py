@@ -0,0 +1,74 @@
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.settings import get_settings
+
+
+@dataclass
+class QueryProfile:
+    """Consultas SQL executadas durante uma requisição"""
+
+    scope: dict = field(repr=False)
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def route(self) -> str:
+        # O roteador preenche scope['route'] ao encontrar o endpoint
+        route = self.scope.get('route')
+        path = route.path if route is not None else self.scope['path']
+        return f'{self.scope["method"]} {path}'
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+current_profile: ContextVar[QueryProfile | None] = ContextVar(
+    'current_profile', default=None
+)
+
+
+def _before_cursor_execute(
+    conn: Connection, cursor: Any, statement: str, *args: Any
+) -> None:
+    if current_profile.get() is not None:
+        conn.info['query_started_at'] = time.perf_counter()
+
+
+def instrument(engine: Engine) -> None:
+    slow_query_seconds = get_settings().SLOW_QUERY_MS / 1000
+
+    def after_cursor_execute(
+        conn: Connection, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        profile = current_profile.get()
+        started_at = conn.info.pop('query_started_at', None)
+        if profile is None or started_at is None:
+            return
+        duration = time.perf_counter() - started_at
+        profile.record(statement, duration)
+        if duration >= slow_query_seconds:
+            logger.warning(
+                f'Slow query ({duration * 1000:.1f} ms) on {profile.route}: '
+                f'{statement}'
+            )
+
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', after_cursor_execute)
@@ -0,0 +1,94 @@
+import itertools
+import threading
+from typing import Any, Literal, Protocol, Sequence
+
+from sqlalchemy import Engine, Select
+from sqlalchemy.orm import Session
+
+from app.core.settings import get_settings
+
+
+class ReplicaSelector(Protocol):
+    def select(self, replicas: Sequence[Engine]) -> Engine: ...
+
+
+class RoundRobinSelector:
+    def __init__(self):
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def select(self, replicas: Sequence[Engine]) -> Engine:
+        with self._lock:
+            return replicas[next(self._counter) % len(replicas)]
+
+
+class LeastConnectionsSelector:
+    @staticmethod
+    def select(replicas: Sequence[Engine]) -> Engine:
+        return min(replicas, key=checked_out_connections)
+
+
+def checked_out_connections(engine: Engine) -> int:
+    checkedout = getattr(engine.pool, 'checkedout', None)
+    return checkedout() if checkedout is not None else 0
+
+
+REPLICA_SELECTORS = {
+    'round_robin': RoundRobinSelector,
+    'least_connections': LeastConnectionsSelector,
+}
+
+
+def build_selector(
+    strategy: Literal['round_robin', 'least_connections'],
+) -> ReplicaSelector:
+    return REPLICA_SELECTORS[strategy]()
+
+
+def is_read_only(clause: Any) -> bool:
+    return isinstance(clause, Select) and clause._for_update_arg is None
+
+
+class RoutingSession(Session):
+    """
+    Envia SELECTs para as réplicas e todo o resto (flush, INSERT, UPDATE,
+    SELECT ... FOR UPDATE) para o banco primário (``bind``).
+
+    Depois da primeira escrita, a sessão passa a ler só do primário, para
+    que a mesma requisição enxergue o que acabou de gravar.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        replicas: Sequence[Engine] = (),
+        selector: ReplicaSelector | None = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.replicas = list(replicas)
+        self.selector = selector or RoundRobinSelector()
+        self.sticky_to_primary = False
+
+    def get_bind(self, mapper: Any = None, *, clause: Any = None, **kwargs: Any):
+        if (
+            self.replicas
+            and kwargs.get('bind') is None
+            and not self.sticky_to_primary
+            and not self._flushing
+            and is_read_only(clause)
+        ):
+            return self.selector.select(self.replicas)
+        self.sticky_to_primary = True
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+def routing_options(replicas: Sequence[Engine], asynchronous: bool = False) -> dict:
+    """Parâmetros do sessionmaker para ler das réplicas, a partir das Settings"""
+    if not replicas:
+        return {}
+    return {
+        'sync_session_class' if asynchronous else 'class_': RoutingSession,
+        'replicas': replicas,
+        'selector': build_selector(get_settings().DB_REPLICA_STRATEGY),
+    }
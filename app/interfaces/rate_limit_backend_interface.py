@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+
+class IRateLimitBackend(ABC):
+    @abstractmethod
+    def hit(self, key: str, limit: int, window: float) -> float | None:
+        """
+        Registra uma tentativa para ``key``. Retorna None se ela cabe em
+        ``limit`` tentativas por ``window`` segundos, ou os segundos até a
+        próxima tentativa ser aceita.
+        """
+        pass
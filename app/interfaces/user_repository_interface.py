@@ -16,3 +16,11 @@ class IUserRepository(ABC):
     @abstractmethod
     def get_user_by_id(self, user_id: str) -> User | None:
         pass
+
+    @abstractmethod
+    def update_password(self, user: User, hashed_password: str) -> User:
+        pass
+
+    @abstractmethod
+    def increment_token_version(self, user: User) -> User:
+        pass
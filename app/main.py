@@ -1,32 +1,68 @@
-from contextlib import asynccontextmanager
+import time
+from contextlib import asynccontextmanager, contextmanager
 
 from fastapi import FastAPI, status
+from fastapi.responses import ORJSONResponse
+from loguru import logger
 from starlette.middleware.cors import CORSMiddleware
 
-from app.core.settings import Settings
-from app.db.database import run_migrations, test_connection
+from app.core.metrics import mark_process_dead
+from app.core.password_pool import password_pool
+from app.core.settings import get_settings
+from app.db.database import (
+    run_migrations,
+    test_connection,
+    warm_up_async_pool,
+    warm_up_pool,
+)
 from app.middlewares.authentication import AuthenticationMiddleware
 from app.middlewares.erro_handling import create_exception_handler
+from app.middlewares.metrics import MetricsMiddleware
+from app.middlewares.query_profiler import QueryProfilerMiddleware
+from app.routes.admin_route import router as admin_router
 from app.routes.auth_route import router as auth_router
+from app.routes.metrics_route import router as metrics_router
 from app.routes.ping import router as ping_route
 from app.routes.user_route import router as user_router
 from app.types.exceptions import (
     DataConflictError,
     InvalidCredentialsError,
+    InvalidPayloadError,
+    InvalidTokenError,
     NotAuthenticatedError,
     PermissionDeniedError,
+    ServiceUnavailableError,
+    TooManyRequestsError,
 )
 
 
+@contextmanager
+def startup_phase(name: str):
+    started_at = time.perf_counter()
+    yield
+    elapsed = (time.perf_counter() - started_at) * 1000
+    logger.info(f'Startup phase "{name}" took {elapsed:.1f} ms.')
+
+
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    test_connection()
-    if not Settings().LOCAL_ENV:
-        run_migrations()
+    with startup_phase('total'):
+        with startup_phase('connection'):
+            test_connection()
+        if not get_settings().LOCAL_ENV:
+            with startup_phase('migrations'):
+                run_migrations()
+        if get_settings().DB_POOL_WARMUP:
+            with startup_phase('pool warm-up'):
+                warm_up_pool(get_settings().DB_POOL_WARMUP)
+                if get_settings().DATABASE_ASYNC:
+                    await warm_up_async_pool(get_settings().DB_POOL_WARMUP)
     yield
+    password_pool.shutdown()
+    mark_process_dead()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 app.add_middleware(
@@ -39,9 +75,15 @@ app.add_middleware(
 
 app.add_middleware(AuthenticationMiddleware)
 
-app.include_router(user_router, prefix=Settings().API_PREFIX)
-app.include_router(ping_route, prefix=Settings().API_PREFIX)
-app.include_router(auth_router, prefix=Settings().API_PREFIX)
+app.add_middleware(QueryProfilerMiddleware)
+
+app.add_middleware(MetricsMiddleware)
+
+app.include_router(user_router, prefix=get_settings().API_PREFIX)
+app.include_router(ping_route, prefix=get_settings().API_PREFIX)
+app.include_router(auth_router, prefix=get_settings().API_PREFIX)
+app.include_router(admin_router, prefix=get_settings().API_PREFIX)
+app.include_router(metrics_router, prefix=get_settings().API_PREFIX)
 
 
 app.add_exception_handler(
@@ -56,6 +98,11 @@ app.add_exception_handler(
     ),
 )
 
+app.add_exception_handler(
+    exc_class_or_status_code=InvalidTokenError,
+    handler=create_exception_handler(status.HTTP_401_UNAUTHORIZED, 'Invalid token'),
+)
+
 app.add_exception_handler(
     exc_class_or_status_code=NotAuthenticatedError,
     handler=create_exception_handler(
@@ -69,3 +116,22 @@ app.add_exception_handler(
         status.HTTP_400_BAD_REQUEST, 'Data conflict error'
     ),
 )
+
+app.add_exception_handler(
+    exc_class_or_status_code=ServiceUnavailableError,
+    handler=create_exception_handler(
+        status.HTTP_503_SERVICE_UNAVAILABLE, 'Service unavailable'
+    ),
+)
+
+app.add_exception_handler(
+    exc_class_or_status_code=TooManyRequestsError,
+    handler=create_exception_handler(
+        status.HTTP_429_TOO_MANY_REQUESTS, 'Too many requests'
+    ),
+)
+
+app.add_exception_handler(
+    exc_class_or_status_code=InvalidPayloadError,
+    handler=create_exception_handler(status.HTTP_400_BAD_REQUEST, 'Invalid payload'),
+)
@@ -1,55 +1,145 @@
+from typing import Sequence
+from uuid import UUID
+
 from fastapi import status
 from fastapi.responses import JSONResponse
 from loguru import logger
 from sqlalchemy.orm import Session
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from app.core.cache import principal_cache
+from app.core.coalescing import BatchLoader, SingleFlight
+from app.core.metrics import api_exceptions
+from app.core.revocation import revocation_list
 from app.core.security import security
-from app.db.database import get_session
+from app.core.settings import get_settings
+from app.db.database import AsyncSessionLocal, get_session
+from app.models.user import User
+from app.repositories.async_user_repositorie import AsyncUserRepository
 from app.repositories.user_repositorie import UserRepository
 from app.types.exceptions import (
     APIException,
     AuthTokenMissingError,
     InvalidTokenError,
 )
+from app.types.principal import Principal
 
+PUBLIC_PATHS = ('/api/login', '/api/metrics', '/api/token/refresh')
 
-class AuthenticationMiddleware(BaseHTTPMiddleware):
-    @staticmethod
-    async def dispatch(request, call_next):
-        if request.url.path.startswith('/api/login'):
-            return await call_next(request)
-        try:
-            auth_header = request.headers.get('Authorization')
-            if not auth_header or not auth_header.startswith('Bearer '):
-                raise AuthTokenMissingError('Authentication token is missing')
-
-            token = auth_header.split(' ')[1].strip()
-
-            payload = security.verify_access_token(token)
-            user_id = payload.get('user_id')
 
-            session: Session = next(get_session())
-            try:
-                repo = UserRepository(session)
-                user = repo.get_user_by_id(user_id)
-            finally:
-                session.close()
-
-            if user is None:
-                raise InvalidTokenError()
-            request.state.user = user
+class AuthenticationMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.async_database = get_settings().DATABASE_ASYNC
+        self.stateless = get_settings().AUTH_STATELESS
+        self.lookups: SingleFlight[str, User | None] = SingleFlight()
+        batch_window = get_settings().AUTH_BATCH_WINDOW_MS
+        self.batch_loader = (
+            BatchLoader(self._load_users_batch, batch_window / 1000)
+            if batch_window > 0
+            else None
+        )
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or scope['path'].startswith(PUBLIC_PATHS):
+            await self.app(scope, receive, send)
+            return
+        try:
+            user = await self.authenticate(Headers(scope=scope))
         except APIException as e:
             logger.error(f'{e.__class__.__name__}: {e.message}')
-            return JSONResponse(
+            api_exceptions.labels(e.__class__.__name__).inc()
+            response = JSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={'detail': f'{e.message}'},
             )
+            await response(scope, receive, send)
+            return
         except Exception as e:
-            logger.error(f'{e.__class__.__name__}: {e.message}')
-            return JSONResponse(
+            logger.error(f'{e.__class__.__name__}: {e}')
+            response = JSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={'detail': 'Unexpected error while verifying token.'},
             )
-        return await call_next(request)
+            await response(scope, receive, send)
+            return
+
+        scope.setdefault('state', {})['user'] = user
+        await self.app(scope, receive, send)
+
+    async def authenticate(self, headers: Headers) -> User | Principal:
+        auth_header = headers.get('Authorization')
+        if not auth_header or not auth_header.startswith('Bearer '):
+            raise AuthTokenMissingError('Authentication token is missing')
+
+        token = auth_header.split(' ')[1].strip()
+
+        payload = security.verify_access_token(token)
+        user_id = payload.get('user_id')
+        token_version = payload.get('token_version', 0)
+        if revocation_list.is_revoked(user_id, token_version):
+            raise InvalidTokenError()
+
+        if self.stateless:
+            if not user_id or 'user_role' not in payload:
+                raise InvalidTokenError()
+            return Principal(
+                id=user_id, role=payload['user_role'], token_version=token_version
+            )
+
+        user = principal_cache.get(user_id)
+        if user is None:
+            user = await self.lookups.do(user_id, lambda: self.load_user(user_id))
+            if user is None:
+                raise InvalidTokenError()
+            principal_cache.set(user_id, user)
+        if (user.token_version or 0) != token_version:
+            raise InvalidTokenError()
+        return user
+
+    async def load_user(self, user_id: str) -> User | None:
+        if self.batch_loader is not None:
+            # Um id inválido faria falhar a consulta de todo o lote
+            try:
+                user_id = str(UUID(str(user_id)))
+            except ValueError:
+                return None
+            return await self.batch_loader.load(user_id)
+        if self.async_database:
+            return await self._load_user_async(user_id)
+        return await run_in_threadpool(self._load_user, user_id)
+
+    async def _load_users_batch(self, user_ids: list[str]) -> dict[str, User]:
+        if self.async_database:
+            users = await self._load_users_async(user_ids)
+        else:
+            users = await run_in_threadpool(self._load_users, user_ids)
+        return {str(user.id): user for user in users}
+
+    @staticmethod
+    def _load_user(user_id: str) -> User | None:
+        session: Session = next(get_session())
+        try:
+            return UserRepository(session).get_user_by_id(user_id)
+        finally:
+            session.close()
+
+    @staticmethod
+    async def _load_user_async(user_id: str) -> User | None:
+        async with AsyncSessionLocal() as session:
+            return await AsyncUserRepository(session).get_user_by_id(user_id)
+
+    @staticmethod
+    def _load_users(user_ids: list[str]) -> Sequence[User]:
+        session: Session = next(get_session())
+        try:
+            return UserRepository(session).get_users_by_ids(user_ids)
+        finally:
+            session.close()
+
+    @staticmethod
+    async def _load_users_async(user_ids: list[str]) -> Sequence[User]:
+        async with AsyncSessionLocal() as session:
+            return await AsyncUserRepository(session).get_users_by_ids(user_ids)
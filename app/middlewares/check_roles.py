@@ -1,17 +1,37 @@
 from fastapi import Depends, Request
+from sqlalchemy.orm import Session
 
+from app.db.database import get_session
 from app.models.user import User
-from app.types.exceptions import NotAuthenticatedError, PermissionDeniedError
+from app.repositories.user_repositorie import UserRepository
+from app.types.exceptions import (
+    InvalidTokenError,
+    NotAuthenticatedError,
+    PermissionDeniedError,
+)
+from app.types.principal import Principal
 
 
-def get_current_user(request: Request):
+def get_current_user(request: Request) -> User | Principal:
     if not hasattr(request.state, 'user') or request.state.user is None:
         raise NotAuthenticatedError('Not authenticated')
     return request.state.user
 
 
+def get_current_user_row(
+    current_user: User | Principal = Depends(get_current_user),
+    session: Session = Depends(get_session),
+) -> User:
+    if isinstance(current_user, User):
+        return current_user
+    user = UserRepository(session).get_user_by_id(current_user.id)
+    if user is None:
+        raise InvalidTokenError()
+    return user
+
+
 def check_roles(required_roles: list):
-    def role_dependency(user: User = Depends(get_current_user)):
+    def role_dependency(user: User | Principal = Depends(get_current_user)):
         if user.role not in required_roles:
             raise PermissionDeniedError(
                 f'Permission denied, only {", ".join(required_roles)} allowed.'
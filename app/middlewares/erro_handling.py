@@ -4,6 +4,7 @@ from fastapi import Request
 from fastapi.responses import JSONResponse
 from loguru import logger
 
+from app.core.metrics import api_exceptions
 from app.types.exceptions import APIException
 
 
@@ -17,8 +18,11 @@ def create_exception_handler(
             detail['message'] = exc.message
 
         logger.error(f'{exc.__class__.__name__}: {exc.message}')
+        api_exceptions.labels(exc.__class__.__name__).inc()
         return JSONResponse(
-            status_code=status_code, content={'detail': detail['message']}
+            status_code=status_code,
+            content={'detail': detail['message']},
+            headers=exc.headers,
         )
 
     return exception_handler
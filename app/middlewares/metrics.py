@@ -0,0 +1,55 @@
+import time
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    http_request_duration,
+    http_requests,
+    http_requests_in_flight,
+)
+
+UNMATCHED_ROUTE = '<unmatched>'
+
+
+def route_template(scope: Scope) -> str:
+    route = scope.get('route')
+    if route is not None:
+        return route.path
+    # Requisições barradas antes do roteamento (ex.: 401 da autenticação)
+    for route in getattr(scope.get('app'), 'routes', ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        method = scope['method']
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        in_flight = http_requests_in_flight.labels(method)
+        in_flight.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started_at
+            in_flight.dec()
+            labels = (method, route_template(scope), str(status_code))
+            http_requests.labels(*labels).inc()
+            http_request_duration.labels(*labels).observe(duration)
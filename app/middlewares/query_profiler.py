@@ -0,0 +1,44 @@
+from loguru import logger
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.settings import get_settings
+from app.db.profiler import QueryProfile, current_profile
+
+
+class QueryProfilerMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.server_timing = get_settings().LOCAL_ENV
+        self.repeat_threshold = get_settings().QUERY_REPEAT_THRESHOLD
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        profile = QueryProfile(scope)
+        token = current_profile.set(profile)
+
+        async def send_with_timing(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                MutableHeaders(scope=message).append(
+                    'Server-Timing',
+                    f'db;dur={profile.duration * 1000:.2f};'
+                    f'desc="{profile.count} queries"',
+                )
+            await send(message)
+
+        try:
+            await self.app(
+                scope, receive, send_with_timing if self.server_timing else send
+            )
+        finally:
+            current_profile.reset(token)
+            for statement, count in profile.repeated_statements(
+                self.repeat_threshold
+            ):
+                logger.warning(
+                    f'Possible N+1 on {profile.route}: statement executed '
+                    f'{count} times: {statement}'
+                )
@@ -1,25 +1,108 @@
 from datetime import datetime
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Iterable
 from uuid import UUID
 
+from sqlalchemy import Column
 from sqlalchemy.orm import DeclarativeBase
 
+Serializer = Callable[['BaseModel'], dict]
+
+# Limita quantas combinações de campos excluídos ficam em cache por classe
+MAX_CACHED_SERIALIZERS = 32
+
+
+def _convert_any(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _convert_datetime(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _convert_uuid(value: Any) -> Any:
+    # Chaves primárias CHAR(36) também recebem objetos UUID antes do flush
+    return str(value) if isinstance(value, UUID) else value
+
+
+def _column_converter(column: Column) -> Callable[[Any], Any] | None:
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return _convert_any
+    if issubclass(python_type, datetime):
+        return _convert_datetime
+    if issubclass(python_type, UUID) or column.primary_key:
+        return _convert_uuid
+    return None
+
 
 class BaseModel(DeclarativeBase):
+    @classmethod
+    def _serializer(cls, exclude: Iterable[str] = ()) -> Serializer:
+        """
+        Retorna o serializador da classe para o conjunto de campos excluídos,
+        gerando-o e guardando-o em cache no primeiro uso
+        """
+        exclude = frozenset(exclude)
+        serializers = cls.__dict__.get('_serializers')
+        if serializers is None:
+            serializers = {}
+            cls._serializers = serializers
+        serializer = serializers.get(exclude)
+        if serializer is None:
+            serializer = cls._compile_serializer(exclude)
+            if len(serializers) < MAX_CACHED_SERIALIZERS:
+                serializers[exclude] = serializer
+        return serializer
+
+    @classmethod
+    def _compile_serializer(cls, exclude: frozenset[str]) -> Serializer:
+        columns = [c for c in cls.__table__.columns if c.key not in exclude]
+        keys = [column.key for column in columns]
+        if len(keys) > 1:
+            loaded, getter = itemgetter(*keys), attrgetter(*keys)
+        else:
+            loaded = lambda state: tuple(state[key] for key in keys)  # noqa: E731
+            getter = lambda obj: tuple(getattr(obj, key) for key in keys)  # noqa: E731
+        converters = [
+            (column.key, converter)
+            for column in columns
+            if (converter := _column_converter(column)) is not None
+        ]
+
+        def serialize(obj: BaseModel) -> dict:
+            try:
+                # Lê direto do estado carregado, sem passar pelos descritores
+                values = loaded(obj.__dict__)
+            except KeyError:
+                # Atributos expirados ou não carregados disparam o lazy load
+                values = getter(obj)
+            data = dict(zip(keys, values))
+            for key, convert in converters:
+                value = data[key]
+                if value is not None:
+                    data[key] = convert(value)
+            return data
+
+        return serialize
+
     def to_dict(self, exclude: list[str] = None) -> dict:
         """
         Converte a instância para um dicionário, excluindo campos especificados
         """
-        exclude = exclude or []
-        data = {}
-
-        for column in self.__table__.columns.keys():
-            if column not in exclude:
-                value = getattr(self, column)
-                if isinstance(value, datetime):
-                    data[column] = value.isoformat()  # Formata datas
-                elif isinstance(value, UUID):
-                    data[column] = str(value)  # Converte UUID para string
-                else:
-                    data[column] = value
-
-        return data
+        return self._serializer(exclude or ())(self)
+
+    @classmethod
+    def to_dicts(
+        cls, rows: Iterable['BaseModel'], exclude: list[str] = None
+    ) -> list[dict]:
+        """
+        Converte várias instâncias de uma vez, reaproveitando o mesmo serializador
+        """
+        serialize = cls._serializer(exclude or ())
+        return [serialize(row) for row in rows]
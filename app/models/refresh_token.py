@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base_model import BaseModel
+from app.models.types import BinaryUUID, Timestamp, new_uuid
+
+
+@dataclass
+class RefreshToken(BaseModel):
+    __tablename__ = 'refresh_tokens'
+
+    id: Mapped[UUID] = mapped_column(BinaryUUID, primary_key=True, default=new_uuid)
+    user_id: Mapped[UUID] = mapped_column(
+        BinaryUUID, ForeignKey('users.id', ondelete='CASCADE'), index=True
+    )
+    # Só o SHA-256 do token é guardado; o token em si fica apenas com o cliente
+    token_hash: Mapped[str] = mapped_column(String(64), unique=True)
+    expires_at: Mapped[datetime] = mapped_column(Timestamp)
+    created_at: Mapped[datetime] = mapped_column(
+        Timestamp, server_default=func.now()
+    )
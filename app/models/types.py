@@ -0,0 +1,74 @@
+import os
+import time
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import BINARY, DateTime
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+# Mesmo formato do CURRENT_TIMESTAMP do SQLite, para que as comparações de
+# paginação por cursor no created_at funcionem
+Timestamp = DateTime().with_variant(
+    sqlite.DATETIME(
+        storage_format='%(year)04d-%(month)02d-%(day)02d '
+        '%(hour)02d:%(minute)02d:%(second)02d'
+    ),
+    'sqlite',
+)
+
+
+class BinaryUUID(TypeDecorator):
+    """UUID armazenado em 16 bytes (BINARY(16)) em vez de texto"""
+
+    impl = BINARY(16)
+    cache_ok = True
+
+    @property
+    def python_type(self) -> type:
+        return UUID
+
+    @staticmethod
+    def process_bind_param(value: Any, dialect: Dialect) -> bytes | None:
+        if value is None:
+            return None
+        if not isinstance(value, UUID):
+            value = UUID(str(value))
+        return value.bytes
+
+    @staticmethod
+    def process_result_value(value: Any, dialect: Dialect) -> UUID | None:
+        if value is None:
+            return None
+        return UUID(bytes=bytes(value))
+
+
+def parse_uuid(value: Any) -> UUID | None:
+    """Converte um id para UUID; ids malformados viram None"""
+    try:
+        return value if isinstance(value, UUID) else UUID(str(value))
+    except ValueError:
+        return None
+
+
+def uuid7() -> UUID:
+    """
+    Gera um UUIDv7 (RFC 9562): os 48 bits iniciais são o timestamp em
+    milissegundos, então ids novos são inseridos no fim do índice
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms << 80) | int.from_bytes(os.urandom(10), 'big')
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return UUID(int=value)
+
+
+UUID_FACTORIES = {4: uuid4, 7: uuid7}
+
+
+def new_uuid() -> UUID:
+    # Importado aqui para que os modelos não leiam as Settings ao serem importados
+    from app.core.settings import get_settings  # noqa: PLC0415
+
+    return UUID_FACTORIES[get_settings().UUID_VERSION]()
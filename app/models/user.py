@@ -1,19 +1,23 @@
 from dataclasses import dataclass
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import Enum, String, func
-from sqlalchemy.dialects.mysql import CHAR
+from sqlalchemy import Enum, Index, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base_model import BaseModel
+from app.models.types import BinaryUUID, Timestamp, new_uuid
 
 
 @dataclass
 class User(BaseModel):
     __tablename__ = 'users'
+    __table_args__ = (
+        Index('ix_users_created_at_id', 'created_at', 'id'),
+        Index('ix_users_role_created_at_id', 'role', 'created_at', 'id'),
+    )
 
-    id: Mapped[UUID] = mapped_column(CHAR(36), primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(BinaryUUID, primary_key=True, default=new_uuid)
     full_name: Mapped[str] = mapped_column(String(255))
     password: Mapped[str] = mapped_column(String(100))
     email: Mapped[str] = mapped_column(String(255), unique=True)
@@ -21,7 +25,10 @@ class User(BaseModel):
     role: Mapped[str] = mapped_column(
         Enum('User', 'Editor', 'Admin', name='user_roles'), default='User'
     )
-    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
+    token_version: Mapped[int] = mapped_column(default=0, server_default=text('0'))
+    created_at: Mapped[datetime] = mapped_column(
+        Timestamp, server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        server_default=func.now(), onupdate=func.now()
+        Timestamp, server_default=func.now(), onupdate=func.now()
     )
@@ -0,0 +1,67 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+
+
+class AsyncRefreshTokenRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_refresh_token(
+        self, user_id: UUID, token_hash: str, expires_at: datetime, now: datetime
+    ) -> None:
+        # Aproveita a emissão para apagar os tokens já expirados do usuário
+        await self.db.execute(
+            delete(RefreshToken).where(
+                RefreshToken.user_id == user_id, RefreshToken.expires_at <= now
+            )
+        )
+        self.db.add(
+            RefreshToken(
+                user_id=user_id, token_hash=token_hash, expires_at=expires_at
+            )
+        )
+        await self.db.commit()
+
+    async def get_active_token_with_user(
+        self, token_hash: str, now: datetime
+    ) -> tuple[RefreshToken, User] | None:
+        # FOR UPDATE lê do primário e trava o token até a rotação terminar
+        result = await self.db.execute(
+            select(RefreshToken, User)
+            .join(User, RefreshToken.user_id == User.id)
+            .where(
+                RefreshToken.token_hash == token_hash, RefreshToken.expires_at > now
+            )
+            .with_for_update(of=RefreshToken)
+        )
+        return result.first()
+
+    async def rotate_refresh_token(
+        self, token: RefreshToken, token_hash: str, expires_at: datetime
+    ) -> bool:
+        """Troca ``token`` por um novo; False se ele já tinha sido usado"""
+        result = await self.db.execute(
+            delete(RefreshToken).where(RefreshToken.id == token.id)
+        )
+        if result.rowcount != 1:
+            await self.db.rollback()
+            return False
+        self.db.add(
+            RefreshToken(
+                user_id=token.user_id, token_hash=token_hash, expires_at=expires_at
+            )
+        )
+        await self.db.commit()
+        return True
+
+    async def delete_user_tokens(self, user_id: UUID) -> None:
+        await self.db.execute(
+            delete(RefreshToken).where(RefreshToken.user_id == user_id)
+        )
+        await self.db.commit()
@@ -0,0 +1,75 @@
+from typing import Sequence
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.password_pool import password_pool
+from app.interfaces.user_repository_interface import IUserRepository
+from app.models.types import parse_uuid
+from app.models.user import User
+from app.types.schemas import UserPayload
+
+
+class AsyncUserRepository(IUserRepository):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_user(self, user: UserPayload) -> User:
+        hashed_password = await password_pool.ahash_password(user.password)
+        db_user = User(
+            full_name=user.full_name,
+            password=hashed_password,
+            email=user.email,
+            registration_number=user.registration_number,
+            role=user.role,
+        )
+        self.db.add(db_user)
+        await self.db.commit()
+        await self.db.refresh(db_user)
+        return db_user
+
+    async def update_password(self, user: User, hashed_password: str) -> User:
+        user.password = hashed_password
+        await self.db.commit()
+        await self.db.refresh(user)
+        return user
+
+    async def increment_token_version(self, user: User) -> User:
+        user.token_version = (user.token_version or 0) + 1
+        await self.db.commit()
+        await self.db.refresh(user)
+        return user
+
+    async def get_user_by_email(self, email: str) -> User | None:
+        return await self.db.scalar(select(User).where(User.email == email))
+
+    async def get_user_by_registration_number(self, re: str) -> User | None:
+        return await self.db.scalar(
+            select(User).where(User.registration_number == re)
+        )
+
+    async def get_user_by_id(self, user_id: str) -> User | None:
+        user_uuid = parse_uuid(user_id)
+        if user_uuid is None:
+            return None
+        return await self.db.scalar(select(User).where(User.id == user_uuid))
+
+    async def get_users_by_ids(self, user_ids: list[str]) -> Sequence[User]:
+        user_uuids = [uuid for uuid in map(parse_uuid, user_ids) if uuid is not None]
+        if not user_uuids:
+            return []
+        result = await self.db.scalars(select(User).where(User.id.in_(user_uuids)))
+        return result.all()
+
+    async def get_conflicting_users(
+        self, emails: list[str], registration_numbers: list[str]
+    ) -> list[tuple[str, str]]:
+        result = await self.db.execute(
+            select(User.email, User.registration_number).where(
+                or_(
+                    User.email.in_(emails),
+                    User.registration_number.in_(registration_numbers),
+                )
+            )
+        )
+        return result.all()
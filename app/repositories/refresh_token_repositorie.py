@@ -0,0 +1,64 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+
+
+class RefreshTokenRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create_refresh_token(
+        self, user_id: UUID, token_hash: str, expires_at: datetime, now: datetime
+    ) -> None:
+        # Aproveita a emissão para apagar os tokens já expirados do usuário
+        self.db.execute(
+            delete(RefreshToken).where(
+                RefreshToken.user_id == user_id, RefreshToken.expires_at <= now
+            )
+        )
+        self.db.add(
+            RefreshToken(
+                user_id=user_id, token_hash=token_hash, expires_at=expires_at
+            )
+        )
+        self.db.commit()
+
+    def get_active_token_with_user(
+        self, token_hash: str, now: datetime
+    ) -> tuple[RefreshToken, User] | None:
+        # FOR UPDATE lê do primário e trava o token até a rotação terminar
+        return self.db.execute(
+            select(RefreshToken, User)
+            .join(User, RefreshToken.user_id == User.id)
+            .where(
+                RefreshToken.token_hash == token_hash, RefreshToken.expires_at > now
+            )
+            .with_for_update(of=RefreshToken)
+        ).first()
+
+    def rotate_refresh_token(
+        self, token: RefreshToken, token_hash: str, expires_at: datetime
+    ) -> bool:
+        """Troca ``token`` por um novo; False se ele já tinha sido usado"""
+        deleted = self.db.execute(
+            delete(RefreshToken).where(RefreshToken.id == token.id)
+        ).rowcount
+        if deleted != 1:
+            self.db.rollback()
+            return False
+        self.db.add(
+            RefreshToken(
+                user_id=token.user_id, token_hash=token_hash, expires_at=expires_at
+            )
+        )
+        self.db.commit()
+        return True
+
+    def delete_user_tokens(self, user_id: UUID) -> None:
+        self.db.execute(delete(RefreshToken).where(RefreshToken.user_id == user_id))
+        self.db.commit()
@@ -1,9 +1,17 @@
+from datetime import datetime
+from typing import Iterator, Sequence
+from uuid import UUID
+
+from sqlalchemy import and_, event, insert, inspect, or_, select
 from sqlalchemy.orm import Session
 
-from app.core.security import security
+from app.core.cache import principal_cache
+from app.core.password_pool import password_pool
+from app.core.revocation import revocation_list
 from app.interfaces.user_repository_interface import IUserRepository
+from app.models.types import parse_uuid
 from app.models.user import User
-from app.types.schemas import UserPayload
+from app.types.schemas import UserFilters, UserPayload
 
 
 class UserRepository(IUserRepository):
@@ -11,7 +19,7 @@ class UserRepository(IUserRepository):
         self.db = db
 
     def create_user(self, user: UserPayload) -> User:
-        hashed_password = security.hash_password(user.password)
+        hashed_password = password_pool.hash_password(user.password)
         db_user = User(
             full_name=user.full_name,
             password=hashed_password,
@@ -24,6 +32,22 @@ class UserRepository(IUserRepository):
         self.db.refresh(db_user)
         return db_user
 
+    def create_users(self, users: list[dict]) -> None:
+        self.db.execute(insert(User), users)
+        self.db.commit()
+
+    def update_password(self, user: User, hashed_password: str) -> User:
+        user.password = hashed_password
+        self.db.commit()
+        self.db.refresh(user)
+        return user
+
+    def increment_token_version(self, user: User) -> User:
+        user.token_version = (user.token_version or 0) + 1
+        self.db.commit()
+        self.db.refresh(user)
+        return user
+
     def get_user_by_email(self, email: str) -> User | None:
         return self.db.query(User).filter(User.email == email).first()
 
@@ -31,4 +55,94 @@ class UserRepository(IUserRepository):
         return self.db.query(User).filter(User.registration_number == re).first()
 
     def get_user_by_id(self, user_id: str) -> User | None:
-        return self.db.query(User).filter(User.id == user_id).first()
+        user_uuid = parse_uuid(user_id)
+        if user_uuid is None:
+            return None
+        return self.db.query(User).filter(User.id == user_uuid).first()
+
+    def get_users_by_ids(self, user_ids: list[str]) -> Sequence[User]:
+        user_uuids = [uuid for uuid in map(parse_uuid, user_ids) if uuid is not None]
+        if not user_uuids:
+            return []
+        return self.db.scalars(select(User).where(User.id.in_(user_uuids))).all()
+
+    def list_users(
+        self,
+        limit: int,
+        cursor: tuple[datetime, UUID] | None = None,
+        filters: UserFilters | None = None,
+    ) -> list[User]:
+        filters = filters or UserFilters()
+        query = select(User)
+        if cursor is not None:
+            created_at, user_id = cursor
+            query = query.where(
+                or_(
+                    User.created_at < created_at,
+                    and_(User.created_at == created_at, User.id < user_id),
+                )
+            )
+        if filters.role is not None:
+            query = query.where(User.role == filters.role)
+        if filters.created_from is not None:
+            query = query.where(User.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            query = query.where(User.created_at < filters.created_to)
+        if filters.email_prefix:
+            query = query.where(
+                User.email.startswith(filters.email_prefix, autoescape=True)
+            )
+        query = query.order_by(User.created_at.desc(), User.id.desc()).limit(limit)
+        return list(self.db.scalars(query))
+
+    def iter_user_batches(self, batch_size: int) -> Iterator[Sequence[User]]:
+        query = select(User).order_by(User.created_at, User.id)
+        users = self.db.scalars(query.execution_options(yield_per=batch_size))
+        return users.partitions()
+
+    def get_conflicting_users(
+        self, emails: list[str], registration_numbers: list[str]
+    ) -> list[tuple[str, str]]:
+        return self.db.execute(
+            select(User.email, User.registration_number).where(
+                or_(
+                    User.email.in_(emails),
+                    User.registration_number.in_(registration_numbers),
+                )
+            )
+        ).all()
+
+
+@event.listens_for(User, 'before_update')
+def _bump_token_version_on_role_change(_mapper, _connection, target: User) -> None:
+    if inspect(target).attrs.role.history.has_changes():
+        target.token_version = (target.token_version or 0) + 1
+
+
+@event.listens_for(Session, 'after_flush')
+def _track_written_users(session: Session, _flush_context) -> None:
+    written = session.info.setdefault('written_user_ids', set())
+    revoked = session.info.setdefault('revoked_token_versions', {})
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, User):
+            written.add(str(obj.id))
+            if obj in session.dirty and (
+                inspect(obj).attrs.token_version.history.has_changes()
+            ):
+                revoked[str(obj.id)] = obj.token_version
+
+
+@event.listens_for(Session, 'after_commit')
+def _apply_written_users(session: Session) -> None:
+    for user_id, token_version in session.info.pop(
+        'revoked_token_versions', {}
+    ).items():
+        revocation_list.revoke(user_id, token_version)
+    _invalidate_written_users(session)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _invalidate_written_users(session: Session) -> None:
+    session.info.pop('revoked_token_versions', None)
+    for user_id in session.info.pop('written_user_ids', ()):
+        principal_cache.invalidate(user_id)
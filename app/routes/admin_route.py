@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, status
+
+from app.core.cache import principal_cache
+from app.core.password_pool import password_pool
+from app.core.security import security
+from app.db.database import pool_stats
+from app.middlewares.check_roles import check_roles
+from app.types.schemas import CacheStats, ConnectionPoolStats, PasswordPoolStats
+
+router = APIRouter(prefix='/admin')
+
+
+@router.get(
+    '/cache',
+    status_code=status.HTTP_200_OK,
+    response_model=dict[str, CacheStats],
+)
+def cache_stats(_: None = Depends(check_roles(['Admin']))):
+    return {
+        'principals': principal_cache.stats(),
+        'tokens': security.token_cache.stats(),
+    }
+
+
+@router.get(
+    '/password-pool',
+    status_code=status.HTTP_200_OK,
+    response_model=PasswordPoolStats,
+)
+def password_pool_stats(_: None = Depends(check_roles(['Admin']))):
+    return password_pool.stats()
+
+
+@router.get(
+    '/db-pool',
+    status_code=status.HTTP_200_OK,
+    response_model=dict[str, ConnectionPoolStats],
+)
+def db_pool_stats(_: None = Depends(check_roles(['Admin']))):
+    return pool_stats()
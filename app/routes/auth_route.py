@@ -1,19 +1,109 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.database import get_session
-from app.services.auth_service import AuthService
-from app.types.schemas import LoginPayload, LoginResponse, UserResponse
+from app.core.settings import get_settings
+from app.db.database import get_async_session, get_session
+from app.middlewares.check_roles import get_current_user
+from app.services.auth_service import AsyncAuthService, AuthService
+from app.types.principal import Principal
+from app.types.schemas import (
+    LoginPayload,
+    LoginResponse,
+    MessageResponse,
+    RefreshPayload,
+    TokenResponse,
+)
 
 router = APIRouter()
 
 
-@router.post('/login', status_code=status.HTTP_200_OK, response_model=LoginResponse)
-def login(user: LoginPayload, session: Session = Depends(get_session)):
-    service = AuthService(session)
-    token, _user = service.login(user)
-    return LoginResponse(
-        message='Login successful!',
-        token=token,
-        user=UserResponse.model_validate(_user.to_dict()),
+def client_host(request: Request) -> str | None:
+    return request.client.host if request.client else None
+
+
+if get_settings().DATABASE_ASYNC:
+
+    @router.post(
+        '/login', status_code=status.HTTP_200_OK, response_model=LoginResponse
+    )
+    async def login(
+        user: LoginPayload,
+        request: Request,
+        session: AsyncSession = Depends(get_async_session),
+    ):
+        service = AsyncAuthService(session)
+        token, refresh_token, _user = await service.login(user, client_host(request))
+        return LoginResponse(
+            message='Login successful!',
+            token=token,
+            refresh_token=refresh_token,
+            user=_user,
+        )
+
+    @router.post(
+        '/token/refresh',
+        status_code=status.HTTP_200_OK,
+        response_model=TokenResponse,
+    )
+    async def refresh_token(
+        payload: RefreshPayload, session: AsyncSession = Depends(get_async_session)
+    ):
+        service = AsyncAuthService(session)
+        token, refresh_token = await service.refresh(payload.refresh_token)
+        return TokenResponse(
+            message='Token refreshed!', token=token, refresh_token=refresh_token
+        )
+
+    @router.post(
+        '/logout', status_code=status.HTTP_200_OK, response_model=MessageResponse
+    )
+    async def logout(
+        current_user: Principal = Depends(get_current_user),
+        session: AsyncSession = Depends(get_async_session),
+    ):
+        service = AsyncAuthService(session)
+        await service.logout(str(current_user.id))
+        return MessageResponse(message='Logout successful!')
+
+else:
+
+    @router.post(
+        '/login', status_code=status.HTTP_200_OK, response_model=LoginResponse
+    )
+    def login(
+        user: LoginPayload, request: Request, session: Session = Depends(get_session)
+    ):
+        service = AuthService(session)
+        token, refresh_token, _user = service.login(user, client_host(request))
+        return LoginResponse(
+            message='Login successful!',
+            token=token,
+            refresh_token=refresh_token,
+            user=_user,
+        )
+
+    @router.post(
+        '/token/refresh',
+        status_code=status.HTTP_200_OK,
+        response_model=TokenResponse,
+    )
+    def refresh_token(
+        payload: RefreshPayload, session: Session = Depends(get_session)
+    ):
+        service = AuthService(session)
+        token, refresh_token = service.refresh(payload.refresh_token)
+        return TokenResponse(
+            message='Token refreshed!', token=token, refresh_token=refresh_token
+        )
+
+    @router.post(
+        '/logout', status_code=status.HTTP_200_OK, response_model=MessageResponse
     )
+    def logout(
+        current_user: Principal = Depends(get_current_user),
+        session: Session = Depends(get_session),
+    ):
+        service = AuthService(session)
+        service.logout(str(current_user.id))
+        return MessageResponse(message='Logout successful!')
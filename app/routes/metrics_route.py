@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response, status
+
+from app.core.metrics import render_metrics
+
+router = APIRouter()
+
+
+@router.get('/metrics', status_code=status.HTTP_200_OK, include_in_schema=False)
+def metrics():
+    content, content_type = render_metrics()
+    return Response(content=content, media_type=content_type)
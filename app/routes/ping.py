@@ -1,22 +1,28 @@
-from datetime import datetime, timezone
+from datetime import datetime, timezone, tzinfo
+from functools import cache
 
-import pytz
 from fastapi import APIRouter, status
 
-from app.core.settings import Settings
+from app.core.settings import get_settings
 from app.types.schemas import PingResponse
 
 router = APIRouter()
 
 
+@cache
+def br_timezone() -> tzinfo:
+    import pytz  # noqa: PLC0415
+
+    return pytz.timezone('America/Sao_Paulo')
+
+
 @router.get('/ping', status_code=status.HTTP_200_OK, response_model=PingResponse)
 def read_root():
-    br_tz = pytz.timezone('America/Sao_Paulo')
-    timestamp = datetime.now(timezone.utc).isoformat()
+    settings = get_settings()
     return {
-        'project_name': Settings().PROJECT_NAME,
-        'version': Settings().VERSION,
-        'timestamp_br': datetime.fromisoformat(timestamp)
-        .astimezone(br_tz)
+        'project_name': settings.PROJECT_NAME,
+        'version': settings.VERSION,
+        'timestamp_br': datetime.now(timezone.utc)
+        .astimezone(br_timezone())
         .strftime('%d/%m/%Y %H:%M:%S'),
     }
@@ -1,25 +1,162 @@
-from fastapi import APIRouter, Depends, status
+from typing import Annotated, Literal, Optional
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.db.database import get_session
-from app.middlewares.check_roles import check_roles
-from app.services.user_service import UserService
-from app.types.schemas import ResponseCreate, UserPayload, UserResponse
+from app.core.etag import etag_matches, user_etag
+from app.core.json_stream import iter_json_rows
+from app.core.settings import get_settings
+from app.db.database import SessionLocal, get_async_session, get_session
+from app.middlewares.check_roles import check_roles, get_current_user_row
+from app.models.user import User
+from app.services.user_service import AsyncUserService, UserService
+from app.types.exceptions import InvalidPayloadError
+from app.types.schemas import (
+    BulkRegisterResponse,
+    BulkUserResult,
+    ResponseCreate,
+    UserFilters,
+    UserPage,
+    UserPayload,
+    UserResponse,
+)
 
 router = APIRouter(prefix='/user')
 
 
+if get_settings().DATABASE_ASYNC:
+
+    @router.post(
+        '/register',
+        status_code=status.HTTP_201_CREATED,
+        response_model=ResponseCreate[UserResponse],
+    )
+    async def create_user(
+        user: UserPayload,
+        session: AsyncSession = Depends(get_async_session),
+        _: None = Depends(check_roles(['Admin'])),
+    ):
+        service = AsyncUserService(session)
+        db_user = await service.user_register(user)
+        return ResponseCreate[UserResponse](
+            message='User created with success.', data=db_user
+        )
+
+else:
+
+    @router.post(
+        '/register',
+        status_code=status.HTTP_201_CREATED,
+        response_model=ResponseCreate[UserResponse],
+    )
+    def create_user(
+        user: UserPayload,
+        session: Session = Depends(get_session),
+        _: None = Depends(check_roles(['Admin'])),
+    ):
+        service = UserService(session)
+        db_user = service.user_register(user)
+        return ResponseCreate[UserResponse](
+            message='User created with success.', data=db_user
+        )
+
+
 @router.post(
-    '/register',
-    status_code=status.HTTP_201_CREATED,
-    response_model=ResponseCreate[UserResponse],
+    '/register/bulk',
+    status_code=status.HTTP_200_OK,
+    response_model=BulkRegisterResponse,
 )
-def create_user(
-    user: UserPayload,
+async def bulk_create_users(
+    request: Request,
     session: Session = Depends(get_session),
     _: None = Depends(check_roles(['Admin'])),
 ):
     service = UserService(session)
-    db_user = service.user_register(user)
-    public_user = UserResponse.model_validate(db_user.to_dict())
-    return ResponseCreate(message='User created with success.', data=public_user)
+    chunk_size = get_settings().BULK_REGISTER_CHUNK_SIZE
+    results = []
+    chunk = []
+    try:
+        async for row in iter_json_rows(request.stream()):
+            chunk.append((len(results) + len(chunk), row))
+            if len(chunk) >= chunk_size:
+                results += await run_in_threadpool(service.bulk_register, chunk)
+                chunk = []
+    except InvalidPayloadError as e:
+        # Sem nada gravado, o payload inteiro é rejeitado; senão os lotes já
+        # gravados são reportados e o restante do corpo é marcado como inválido
+        if not results:
+            raise
+        results += [
+            BulkUserResult(index=index, status='invalid', detail=e.message)
+            for index in range(len(results), len(results) + len(chunk) + 1)
+        ]
+        chunk = []
+    if chunk:
+        results += await run_in_threadpool(service.bulk_register, chunk)
+
+    created = sum(1 for result in results if result.status == 'created')
+    return BulkRegisterResponse(
+        created=created, failed=len(results) - created, results=results
+    )
+
+
+@router.get(
+    '/me',
+    status_code=status.HTTP_200_OK,
+    response_model=UserResponse,
+    responses={status.HTTP_304_NOT_MODIFIED: {'description': 'Not modified'}},
+)
+def read_current_user(
+    request: Request,
+    response: Response,
+    user: User = Depends(get_current_user_row),
+):
+    etag = user_etag(user)
+    headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+    if etag_matches(request.headers.get('If-None-Match'), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return user
+
+
+@router.get('', status_code=status.HTTP_200_OK, response_model=UserPage)
+def list_users(
+    filters: UserFilters = Depends(),
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    cursor: Optional[str] = None,
+    session: Session = Depends(get_session),
+    _: None = Depends(check_roles(['Admin'])),
+):
+    service = UserService(session)
+    users, next_cursor = service.list_users(limit, cursor, filters)
+    return UserPage(
+        data=users,
+        next_cursor=next_cursor,
+    )
+
+
+EXPORT_MEDIA_TYPES = {'csv': 'text/csv', 'ndjson': 'application/x-ndjson'}
+
+
+@router.get('/export', status_code=status.HTTP_200_OK)
+def export_users(
+    export_format: Annotated[
+        Literal['csv', 'ndjson'], Query(alias='format')
+    ] = 'csv',
+    exclude: Annotated[list[str], Query()] = [],
+    _: None = Depends(check_roles(['Admin'])),
+):
+    def content():
+        with SessionLocal() as session:
+            yield from UserService(session).export_users(export_format, exclude)
+
+    return StreamingResponse(
+        content(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            'Content-Disposition': f'attachment; filename="users.{export_format}"'
+        },
+    )
@@ -0,0 +1,54 @@
+import argparse
+import time
+
+from passlib.context import CryptContext
+from passlib.exc import MissingBackendError
+
+SAMPLE_PASSWORD = 'calibration-password'
+
+
+def ms_per_hash(context: CryptContext, samples: int) -> float:
+    context.hash(SAMPLE_PASSWORD)
+    start = time.perf_counter()
+    for _ in range(samples):
+        context.hash(SAMPLE_PASSWORD)
+    return (time.perf_counter() - start) * 1000 / samples
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Report the ms per password hash for each cost on this machine.'
+    )
+    parser.add_argument(
+        '--bcrypt-rounds', type=int, nargs='+', default=[10, 11, 12, 13]
+    )
+    parser.add_argument('--argon2-time-cost', type=int, nargs='+', default=[2, 3, 4])
+    parser.add_argument('--argon2-memory-cost', type=int, default=65536)
+    parser.add_argument('--argon2-parallelism', type=int, default=4)
+    parser.add_argument('--samples', type=int, default=3)
+    args = parser.parse_args()
+
+    for rounds in args.bcrypt_rounds:
+        context = CryptContext(schemes=['bcrypt'], bcrypt__rounds=rounds)
+        print(f'bcrypt rounds={rounds}: {ms_per_hash(context, args.samples):.1f} ms')
+
+    for time_cost in args.argon2_time_cost:
+        context = CryptContext(
+            schemes=['argon2'],
+            argon2__time_cost=time_cost,
+            argon2__memory_cost=args.argon2_memory_cost,
+            argon2__parallelism=args.argon2_parallelism,
+        )
+        try:
+            elapsed = ms_per_hash(context, args.samples)
+        except MissingBackendError:
+            print('argon2: backend not installed (pip install argon2-cffi)')
+            break
+        print(
+            f'argon2 time_cost={time_cost} memory_cost={args.argon2_memory_cost} '
+            f'parallelism={args.argon2_parallelism}: {elapsed:.1f} ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
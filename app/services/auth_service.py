@@ -1,21 +1,145 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.password_pool import password_pool
+from app.core.rate_limit import login_throttle
 from app.core.security import security
+from app.core.settings import get_settings
+from app.models.user import User
+from app.repositories.async_refresh_token_repositorie import (
+    AsyncRefreshTokenRepository,
+)
+from app.repositories.async_user_repositorie import AsyncUserRepository
+from app.repositories.refresh_token_repositorie import RefreshTokenRepository
 from app.repositories.user_repositorie import UserRepository
-from app.types.exceptions import InvalidCredentialsError
+from app.types.exceptions import InvalidCredentialsError, InvalidTokenError
 from app.types.schemas import LoginPayload
 
 
+def utc_now() -> datetime:
+    # As colunas de data não guardam fuso horário; os prazos são gravados em UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def refresh_token_expires_at(now: datetime) -> datetime:
+    return now + timedelta(days=get_settings().REFRESH_TOKEN_EXPIRE_DAYS)
+
+
+def create_access_token(user: User) -> str:
+    return security.create_access_token({
+        'user_id': str(user.id),
+        'user_role': user.role,
+        'token_version': user.token_version,
+    })
+
+
 class AuthService:
     def __init__(self, db: Session):
         self.user_repo = UserRepository(db)
+        self.token_repo = RefreshTokenRepository(db)
 
-    def login(self, user: LoginPayload):
+    def login(self, user: LoginPayload, client_ip: str | None = None):
+        login_throttle.check(client_ip, user.email)
         user_found = self.user_repo.get_user_by_email(user.email)
         if not user_found:
             raise InvalidCredentialsError('Invalid email or password')
-        if not security.verify_password(user.password, user_found.password):
+        with login_throttle.verification_slot():
+            verified, new_hash = password_pool.verify_and_update(
+                user.password, user_found.password
+            )
+        if not verified:
             raise InvalidCredentialsError('Invalid email or password')
-        payload = {'user_id': str(user_found.id), 'user_role': user_found.role}
-        access_token = security.create_access_token(payload)
-        return access_token, user_found
+        if new_hash:
+            user_found = self.user_repo.update_password(user_found, new_hash)
+        access_token = create_access_token(user_found)
+        refresh_token = security.create_refresh_token()
+        now = utc_now()
+        self.token_repo.create_refresh_token(
+            user_found.id,
+            security.hash_refresh_token(refresh_token),
+            refresh_token_expires_at(now),
+            now,
+        )
+        return access_token, refresh_token, user_found
+
+    def refresh(self, refresh_token: str) -> tuple[str, str]:
+        now = utc_now()
+        found = self.token_repo.get_active_token_with_user(
+            security.hash_refresh_token(refresh_token), now
+        )
+        if found is None:
+            raise InvalidTokenError()
+        stored_token, user = found
+        access_token = create_access_token(user)
+        new_refresh_token = security.create_refresh_token()
+        if not self.token_repo.rotate_refresh_token(
+            stored_token,
+            security.hash_refresh_token(new_refresh_token),
+            refresh_token_expires_at(now),
+        ):
+            raise InvalidTokenError()
+        return access_token, new_refresh_token
+
+    def logout(self, user_id: str) -> None:
+        user_found = self.user_repo.get_user_by_id(user_id)
+        if not user_found:
+            raise InvalidTokenError()
+        self.token_repo.delete_user_tokens(user_found.id)
+        self.user_repo.increment_token_version(user_found)
+
+
+class AsyncAuthService:
+    def __init__(self, db: AsyncSession):
+        self.user_repo = AsyncUserRepository(db)
+        self.token_repo = AsyncRefreshTokenRepository(db)
+
+    async def login(self, user: LoginPayload, client_ip: str | None = None):
+        login_throttle.check(client_ip, user.email)
+        user_found = await self.user_repo.get_user_by_email(user.email)
+        if not user_found:
+            raise InvalidCredentialsError('Invalid email or password')
+        with login_throttle.verification_slot():
+            verified, new_hash = await password_pool.averify_and_update(
+                user.password, user_found.password
+            )
+        if not verified:
+            raise InvalidCredentialsError('Invalid email or password')
+        if new_hash:
+            user_found = await self.user_repo.update_password(user_found, new_hash)
+        access_token = create_access_token(user_found)
+        refresh_token = security.create_refresh_token()
+        now = utc_now()
+        await self.token_repo.create_refresh_token(
+            user_found.id,
+            security.hash_refresh_token(refresh_token),
+            refresh_token_expires_at(now),
+            now,
+        )
+        return access_token, refresh_token, user_found
+
+    async def refresh(self, refresh_token: str) -> tuple[str, str]:
+        now = utc_now()
+        found = await self.token_repo.get_active_token_with_user(
+            security.hash_refresh_token(refresh_token), now
+        )
+        if found is None:
+            raise InvalidTokenError()
+        stored_token, user = found
+        access_token = create_access_token(user)
+        new_refresh_token = security.create_refresh_token()
+        if not await self.token_repo.rotate_refresh_token(
+            stored_token,
+            security.hash_refresh_token(new_refresh_token),
+            refresh_token_expires_at(now),
+        ):
+            raise InvalidTokenError()
+        return access_token, new_refresh_token
+
+    async def logout(self, user_id: str) -> None:
+        user_found = await self.user_repo.get_user_by_id(user_id)
+        if not user_found:
+            raise InvalidTokenError()
+        await self.token_repo.delete_user_tokens(user_found.id)
+        await self.user_repo.increment_token_version(user_found)
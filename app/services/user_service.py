@@ -1,9 +1,43 @@
+import base64
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, Iterator, Literal
+from uuid import UUID
+
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.password_pool import password_pool
+from app.core.settings import get_settings
+from app.models.types import new_uuid
 from app.models.user import User
+from app.repositories.async_user_repositorie import AsyncUserRepository
 from app.repositories.user_repositorie import UserRepository
-from app.types.exceptions import DataConflictError
-from app.types.schemas import UserPayload
+from app.types.exceptions import DataConflictError, InvalidPayloadError
+from app.types.schemas import BulkUserResult, UserFilters, UserPayload
+
+
+def encode_cursor(user: User) -> str:
+    raw = json.dumps([user.created_at.isoformat(), str(user.id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        created_at, user_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(created_at), UUID(user_id)
+    except (TypeError, ValueError):
+        raise InvalidPayloadError('Invalid pagination cursor.')
+
+
+def conflict_message(user: UserPayload, conflicts: list[tuple[str, str]]) -> str:
+    if any(email == user.email for email, _ in conflicts):
+        return 'Email alredy in use.'
+    return 'Registration number alredy in use.'
 
 
 class UserService:
@@ -11,14 +45,123 @@ class UserService:
         self.user_repo = UserRepository(db)
 
     def user_register(self, user: UserPayload) -> User:
-        user_found = self.user_repo.get_user_by_email(user.email)
-        user_found = self.user_repo.get_user_by_registration_number(
-            user.registration_number
+        conflicts = self.user_repo.get_conflicting_users(
+            [user.email], [user.registration_number]
         )
-        if user_found:
-            raise DataConflictError(
-                'Email alredy in use.'
-                if user.email == user_found.email
-                else 'Registration number alredy in use.'
-            )
+        if conflicts:
+            raise DataConflictError(conflict_message(user, conflicts))
         return self.user_repo.create_user(user)
+
+    def list_users(
+        self, limit: int, cursor: str | None, filters: UserFilters
+    ) -> tuple[list[User], str | None]:
+        users = self.user_repo.list_users(
+            limit + 1, decode_cursor(cursor) if cursor else None, filters
+        )
+        if len(users) <= limit:
+            return users, None
+        return users[:limit], encode_cursor(users[limit - 1])
+
+    def export_users(
+        self, export_format: Literal['csv', 'ndjson'], exclude: list[str]
+    ) -> Iterator[str]:
+        exclude = ['password', 'token_version', *exclude]
+        batch_size = get_settings().EXPORT_BATCH_SIZE
+        columns = [c for c in User.__table__.columns.keys() if c not in exclude]
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns, lineterminator='\n')
+        if export_format == 'csv':
+            writer.writeheader()
+
+        for users in self.user_repo.iter_user_batches(batch_size):
+            rows = User.to_dicts(users, exclude)
+            if export_format == 'csv':
+                writer.writerows(rows)
+            else:
+                buffer.writelines(json.dumps(row) + '\n' for row in rows)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    def bulk_register(self, rows: list[tuple[int, Any]]) -> list[BulkUserResult]:
+        results: dict[int, BulkUserResult] = {}
+        payloads: list[tuple[int, UserPayload]] = []
+        for index, row in rows:
+            if isinstance(row, ValueError):
+                results[index] = BulkUserResult(
+                    index=index, status='invalid', detail=str(row)
+                )
+                continue
+            try:
+                payloads.append((index, UserPayload.model_validate(row)))
+            except ValidationError as e:
+                results[index] = BulkUserResult(
+                    index=index, status='invalid', detail=str(e)
+                )
+
+        conflicts = self.user_repo.get_conflicting_users(
+            [payload.email for _, payload in payloads],
+            [payload.registration_number for _, payload in payloads],
+        )
+        emails = {email for email, _ in conflicts}
+        registration_numbers = {number for _, number in conflicts}
+        accepted: list[tuple[int, UserPayload]] = []
+        for index, payload in payloads:
+            if payload.email in emails:
+                detail = 'Email alredy in use.'
+            elif payload.registration_number in registration_numbers:
+                detail = 'Registration number alredy in use.'
+            else:
+                emails.add(payload.email)
+                registration_numbers.add(payload.registration_number)
+                accepted.append((index, payload))
+                continue
+            results[index] = BulkUserResult(
+                index=index, status='conflict', detail=detail
+            )
+
+        hashed_passwords = password_pool.hash_passwords([
+            payload.password for _, payload in accepted
+        ])
+        new_users = [
+            {
+                'id': new_uuid(),
+                'full_name': payload.full_name,
+                'password': hashed_password,
+                'email': payload.email,
+                'registration_number': payload.registration_number,
+                'role': payload.role or 'User',
+            }
+            for (_, payload), hashed_password in zip(accepted, hashed_passwords)
+        ]
+        try:
+            if new_users:
+                self.user_repo.create_users(new_users)
+            status, detail = 'created', None
+        except IntegrityError:
+            self.user_repo.db.rollback()
+            status, detail = 'conflict', 'Conflicts with a concurrent registration.'
+        for (index, _), new_user in zip(accepted, new_users):
+            results[index] = BulkUserResult(
+                index=index,
+                status=status,
+                id=new_user['id'] if status == 'created' else None,
+                detail=detail,
+            )
+
+        return [results[index] for index, _ in rows]
+
+
+class AsyncUserService:
+    def __init__(self, db: AsyncSession):
+        self.user_repo = AsyncUserRepository(db)
+
+    async def user_register(self, user: UserPayload) -> User:
+        conflicts = await self.user_repo.get_conflicting_users(
+            [user.email], [user.registration_number]
+        )
+        if conflicts:
+            raise DataConflictError(conflict_message(user, conflicts))
+        return await self.user_repo.create_user(user)
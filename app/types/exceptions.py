@@ -1,6 +1,11 @@
+import math
+
+
 class APIException(Exception):
     """This is the base class for all API errors"""
 
+    headers: dict[str, str] | None = None
+
     def __init__(self, message: str = 'Service is unavailable'):
         self.message = message
         super().__init__(message)
@@ -45,3 +50,21 @@ class DataConflictError(APIException):
 
 class InvalidCredentialsError(APIException):
     pass
+
+
+class InvalidPayloadError(APIException):
+    pass
+
+
+class ServiceUnavailableError(APIException):
+    """Server is temporarily overloaded and shed the request."""
+
+    pass
+
+
+class TooManyRequestsError(APIException):
+    """Client exceeded a rate limit and should retry later."""
+
+    def __init__(self, retry_after: float):
+        super().__init__('Too many login attempts, please try again later.')
+        self.headers = {'Retry-After': str(math.ceil(retry_after))}
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Principal:
+    id: str
+    role: str
+    token_version: int = 0
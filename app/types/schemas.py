@@ -1,7 +1,8 @@
-from typing import Generic, Optional, TypeVar
+from datetime import datetime
+from typing import Generic, Literal, Optional, TypeVar
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 T = TypeVar('T')
 
@@ -26,12 +27,18 @@ class UserPayload(BaseModel):
 
 
 class UserResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     full_name: str
     email: str
     role: str
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
+
+
+class MessageResponse(BaseModel):
+    message: str
 
 
 class LoginPayload(BaseModel):
@@ -40,6 +47,77 @@ class LoginPayload(BaseModel):
 
 
 class LoginResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     message: str
     user: UserResponse
     token: str
+    refresh_token: str
+
+
+class RefreshPayload(BaseModel):
+    refresh_token: str
+
+
+class TokenResponse(BaseModel):
+    message: str
+    token: str
+    refresh_token: str
+
+
+class CacheStats(BaseModel):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    hit_rate: float
+
+
+class ConnectionPoolStats(BaseModel):
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    max_overflow: int
+    checkouts: int
+    timeouts: int
+    avg_checkout_wait_ms: float
+    max_checkout_wait_ms: float
+
+
+class PasswordPoolStats(BaseModel):
+    workers: int
+    max_queue: int
+    pending: int
+    completed: int
+    rejected: int
+    avg_queue_wait_ms: float
+    max_queue_wait_ms: float
+    avg_execution_ms: float
+
+
+class BulkUserResult(BaseModel):
+    index: int
+    status: Literal['created', 'conflict', 'invalid']
+    id: Optional[UUID] = None
+    detail: Optional[str] = None
+
+
+class BulkRegisterResponse(BaseModel):
+    created: int
+    failed: int
+    results: list[BulkUserResult]
+
+
+class UserFilters(BaseModel):
+    role: Optional[Literal['User', 'Editor', 'Admin']] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    email_prefix: Optional[str] = None
+
+
+class UserPage(BaseModel):
+    data: list[UserResponse]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,26 @@
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from dotenv import load_dotenv
+
+# Os módulos da aplicação leem as Settings ao serem importados
+load_dotenv(Path(__file__).parent.parent / 'tests' / '.env')
+
+
+@pytest.fixture
+def orm_user():
+    from app.models.user import User  # noqa: PLC0415
+
+    return User(
+        id=uuid4(),
+        full_name='Benchmark User',
+        password='hash',
+        email='benchmark@test.com',
+        registration_number='123',
+        role='Admin',
+        token_version=0,
+        created_at=datetime(2025, 3, 21, 16, 46, 38, 685714),
+        updated_at=datetime(2025, 3, 21, 16, 46, 38, 685714),
+    )
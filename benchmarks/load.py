@@ -0,0 +1,241 @@
+"""
+End-to-end load benchmark of the API against a temporary SQLite database.
+
+    python -m benchmarks.load [--concurrency 1 8 32] [--requests 400]
+        [--output results.json] [--baseline previous.json --threshold 10]
+
+The app runs in process behind httpx's ASGI transport, so the numbers
+measure the application stack (middlewares, routing, services, ORM,
+SQLite) without network overhead. With --baseline, the run fails when a
+scenario's RPS drops, or its p95 latency grows, by more than --threshold
+percent.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from itertools import count
+from pathlib import Path
+from typing import Awaitable, Callable
+from uuid import uuid4
+
+import httpx
+
+ADMIN_EMAIL = 'admin@bench.com'
+ADMIN_PASSWORD = 'benchmark'
+
+Scenario = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+def configure_environment(database_path: Path, bcrypt_rounds: int) -> None:
+    os.environ['DATABASE_URL'] = f'sqlite:///{database_path}'
+    os.environ['DATABASE_TYPE'] = 'sqlite'
+    os.environ['DATABASE_ASYNC'] = 'False'
+    # Migrations target MySQL; the schema is created from the models instead
+    os.environ['LOCAL_ENV'] = 'True'
+    os.environ['BCRYPT_ROUNDS'] = str(bcrypt_rounds)
+    # Todas as requisições saem do mesmo IP e email: sem isso o throttle do
+    # login rejeitaria o cenário
+    os.environ['LOGIN_RATE_LIMIT_PER_IP'] = '0'
+    os.environ['LOGIN_RATE_LIMIT_PER_EMAIL'] = '0'
+    os.environ['LOGIN_MAX_CONCURRENT_VERIFICATIONS'] = '0'
+    os.environ.setdefault('SECRET_KEY', 'benchmark-secret')
+    os.environ.setdefault('ALGORITHM', 'HS256')
+
+
+def seed_admin() -> str:
+    from app.core.security import security  # noqa: PLC0415
+    from app.db.database import SessionLocal, engine  # noqa: PLC0415
+    from app.models.base_model import BaseModel  # noqa: PLC0415
+    from app.models.refresh_token import RefreshToken  # noqa: PLC0415, F401
+    from app.models.user import User  # noqa: PLC0415
+
+    BaseModel.metadata.create_all(engine)
+    with SessionLocal() as session:
+        admin = User(
+            full_name='Benchmark Admin',
+            password=security.hash_password(ADMIN_PASSWORD),
+            email=ADMIN_EMAIL,
+            registration_number='admin',
+            role='Admin',
+        )
+        session.add(admin)
+        session.commit()
+        return security.create_access_token({
+            'user_id': str(admin.id),
+            'user_role': admin.role,
+            'token_version': admin.token_version,
+        })
+
+
+def build_scenarios(token: str) -> dict[str, Scenario]:
+    headers = {'Authorization': f'Bearer {token}'}
+    run_id = uuid4().hex[:8]
+
+    def ping(client: httpx.AsyncClient, _: int) -> Awaitable[httpx.Response]:
+        return client.get('/api/ping', headers=headers)
+
+    def login(client: httpx.AsyncClient, _: int) -> Awaitable[httpx.Response]:
+        return client.post(
+            '/api/login', json={'email': ADMIN_EMAIL, 'password': ADMIN_PASSWORD}
+        )
+
+    def register(client: httpx.AsyncClient, i: int) -> Awaitable[httpx.Response]:
+        return client.post(
+            '/api/user/register',
+            headers=headers,
+            json={
+                'full_name': f'Load User {i}',
+                'email': f'load-{run_id}-{i}@bench.com',
+                'password': 'secret',
+                'registration_number': f'{run_id}-{i}',
+            },
+        )
+
+    def list_users(client: httpx.AsyncClient, _: int) -> Awaitable[httpx.Response]:
+        return client.get('/api/user', params={'limit': 20}, headers=headers)
+
+    return {
+        'GET /api/ping': ping,
+        'POST /api/login': login,
+        'POST /api/user/register': register,
+        'GET /api/user': list_users,
+    }
+
+
+def percentile(latencies: list[float], pct: int) -> float:
+    if len(latencies) == 1:
+        return latencies[0]
+    return statistics.quantiles(latencies, n=100, method='inclusive')[pct - 1]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    concurrency: int,
+    requests: int,
+    sequence: count,
+) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            started_at = time.perf_counter()
+            response = await scenario(client, next(sequence))
+            latencies.append(time.perf_counter() - started_at)
+            if response.is_error:
+                errors += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': len(latencies) / elapsed,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p95_ms': percentile(latencies, 95) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+    }
+
+
+async def run(args: argparse.Namespace, token: str) -> dict:
+    from app.main import app  # noqa: PLC0415
+
+    results: dict[str, dict] = {}
+    sequence = count()
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=transport, base_url='http://bench') as client,
+    ):
+        for name, scenario in build_scenarios(token).items():
+            await run_scenario(client, scenario, 1, args.warmup, sequence)
+            results[name] = {}
+            for concurrency in args.concurrency:
+                result = await run_scenario(
+                    client, scenario, concurrency, args.requests, sequence
+                )
+                results[name][str(concurrency)] = result
+                print(
+                    f'{name:<26} c={concurrency:<4} {result["rps"]:>8.1f} rps  '
+                    f'p50 {result["p50_ms"]:>7.2f} ms  '
+                    f'p95 {result["p95_ms"]:>7.2f} ms  '
+                    f'p99 {result["p99_ms"]:>7.2f} ms  '
+                    f'errors {result["errors"]}'
+                )
+    return results
+
+
+def find_regressions(results: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    for name, levels in results.items():
+        for concurrency, result in levels.items():
+            previous = baseline.get(name, {}).get(concurrency)
+            if previous is None:
+                continue
+            rps_drop = (previous['rps'] - result['rps']) / previous['rps'] * 100
+            p95_growth = (
+                (result['p95_ms'] - previous['p95_ms']) / previous['p95_ms'] * 100
+            )
+            if rps_drop > threshold:
+                regressions.append(
+                    f'{name} c={concurrency}: RPS dropped {rps_drop:.1f}% '
+                    f'({previous["rps"]:.1f} -> {result["rps"]:.1f})'
+                )
+            if p95_growth > threshold:
+                regressions.append(
+                    f'{name} c={concurrency}: p95 grew {p95_growth:.1f}% '
+                    f'({previous["p95_ms"]:.2f} -> {result["p95_ms"]:.2f} ms)'
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--bcrypt-rounds', type=int, default=4)
+    parser.add_argument('--output', type=Path)
+    parser.add_argument('--baseline', type=Path)
+    parser.add_argument('--threshold', type=float, default=10.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        configure_environment(Path(directory) / 'bench.db', args.bcrypt_rounds)
+        token = seed_admin()
+        results = asyncio.run(run(args, token))
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'cpus': os.cpu_count(),
+            'requests': args.requests,
+            'bcrypt_rounds': args.bcrypt_rounds,
+        },
+        'results': results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())['results']
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
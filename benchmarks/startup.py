@@ -0,0 +1,108 @@
+"""
+Cold worker boot time: importing app.main and running its startup.
+
+    python -m benchmarks.startup [--runs 10] [--top 15]
+
+Each run is a fresh interpreter, like a new uvicorn worker. It reports
+the median import time, the lifespan startup time and their sum
+(import-to-ready), plus the import time spent in each top-level package
+according to `python -X importtime`.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+CHILD = """
+import asyncio, json, time
+started_at = time.perf_counter()
+from app.main import app
+imported_at = time.perf_counter()
+
+async def boot():
+    async with app.router.lifespan_context(app):
+        ready_at = time.perf_counter()
+    return ready_at
+
+ready_at = asyncio.run(boot())
+print(json.dumps({
+    'import_ms': (imported_at - started_at) * 1000,
+    'startup_ms': (ready_at - imported_at) * 1000,
+}))
+"""
+
+
+def child_environment(database_path: Path) -> dict:
+    env = dict(os.environ)
+    env.update(
+        DATABASE_URL=f'sqlite:///{database_path}',
+        DATABASE_TYPE='sqlite',
+        LOCAL_ENV='True',
+        PYTHONPATH=str(ROOT),
+    )
+    env.setdefault('SECRET_KEY', 'benchmark-secret')
+    env.setdefault('ALGORITHM', 'HS256')
+    return env
+
+
+def boot(env: dict) -> dict:
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD],
+        env=env,
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def heaviest_packages(env: dict, top: int) -> list[tuple[int, str]]:
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app.main'],
+        env=env,
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    packages: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        own_us, _, name = line.removeprefix('import time:').split('|')
+        package = name.strip().split('.')[0]
+        packages[package] = packages.get(package, 0) + int(own_us)
+    return sorted(((us, name) for name, us in packages.items()), reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        env = child_environment(Path(directory) / 'startup.db')
+        runs = [boot(env) for _ in range(args.runs)]
+        packages = heaviest_packages(env, args.top)
+
+    import_ms = statistics.median(run['import_ms'] for run in runs)
+    startup_ms = statistics.median(run['startup_ms'] for run in runs)
+    print(f'import    {import_ms:8.1f} ms')
+    print(f'startup   {startup_ms:8.1f} ms')
+    print(f'ready     {import_ms + startup_ms:8.1f} ms  (median of {args.runs})')
+    print('\nimport time by top-level package:')
+    for own_us, name in packages:
+        print(f'  {own_us / 1000:8.1f} ms  {name}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from app.core.cache import principal_cache
+from app.core.security import security
+from app.core.settings import override_settings
+from app.middlewares.authentication import AuthenticationMiddleware
+from app.middlewares.check_roles import check_roles
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def request_scope(orm_user):
+    token = security.create_access_token({
+        'user_id': str(orm_user.id),
+        'user_role': orm_user.role,
+        'token_version': 0,
+    })
+    return {
+        'type': 'http',
+        'method': 'GET',
+        'path': '/api/user',
+        'headers': [(b'authorization', f'Bearer {token}'.encode())],
+    }
+
+
+async def endpoint(scope, receive, send):
+    pass
+
+
+async def receive():
+    return {'type': 'http.request'}
+
+
+async def send(message):
+    pass
+
+
+def run_middleware(loop, middleware, request_scope):
+    def call():
+        scope = dict(request_scope)
+        loop.run_until_complete(middleware(scope, receive, send))
+        assert scope['state']['user'] is not None
+
+    return call
+
+
+def test_check_roles_dependency(benchmark, orm_user):
+    role_dependency = check_roles(['Editor', 'Admin'])
+
+    benchmark(role_dependency, orm_user)
+
+
+def test_authentication_cached_principal(
+    benchmark, mocker, orm_user, loop, request_scope
+):
+    mocker.patch.object(
+        AuthenticationMiddleware, '_load_user', return_value=orm_user
+    )
+    principal_cache.clear()
+    call = run_middleware(loop, AuthenticationMiddleware(endpoint), request_scope)
+    call()
+
+    benchmark(call)
+
+
+def test_authentication_repository_lookup(
+    benchmark, mocker, orm_user, loop, request_scope
+):
+    mocker.patch.object(
+        AuthenticationMiddleware, '_load_user', return_value=orm_user
+    )
+    mocker.patch.object(principal_cache, 'max_size', 0)
+    principal_cache.clear()
+    middleware = AuthenticationMiddleware(endpoint)
+
+    benchmark(run_middleware(loop, middleware, request_scope))
+
+
+def test_authentication_stateless(benchmark, loop, request_scope):
+    with override_settings(AUTH_STATELESS=True):
+        middleware = AuthenticationMiddleware(endpoint)
+
+    benchmark(run_middleware(loop, middleware, request_scope))
@@ -0,0 +1,50 @@
+import os
+
+import pytest
+
+from app.core.cache import LRUCache
+from app.core.security import SecurityManager, build_password_context
+from app.core.settings import get_settings
+
+BCRYPT_ROUNDS = [
+    int(rounds)
+    for rounds in os.getenv('BENCHMARK_BCRYPT_ROUNDS', '4,10,12').split(',')
+]
+
+
+@pytest.fixture
+def security_manager():
+    return SecurityManager()
+
+
+@pytest.fixture
+def token(security_manager):
+    return security_manager.create_access_token({
+        'user_id': 'user',
+        'user_role': 'Admin',
+        'token_version': 0,
+    })
+
+
+def test_create_access_token(benchmark, security_manager):
+    benchmark(security_manager.create_access_token, {'user_id': 'user'})
+
+
+def test_verify_access_token_cached(benchmark, security_manager, token):
+    benchmark(security_manager.verify_access_token, token)
+
+
+def test_verify_access_token_uncached(benchmark, security_manager, token):
+    security_manager.token_cache = LRUCache(max_size=0)
+
+    benchmark(security_manager.verify_access_token, token)
+
+
+@pytest.mark.parametrize('rounds', BCRYPT_ROUNDS)
+def test_hash_password(benchmark, rounds):
+    settings = get_settings().model_copy(
+        update={'PASSWORD_SCHEMES': ['bcrypt'], 'BCRYPT_ROUNDS': rounds}
+    )
+    context = build_password_context(settings)
+
+    benchmark.pedantic(context.hash, args=('benchmark-password',), rounds=5)
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.models.user import User
+from app.types.schemas import LoginResponse, UserResponse
+
+TOKEN = 'x' * 180
+LOGIN_FIELD = create_model_field(
+    name='Response_login', type_=LoginResponse, mode='serialization'
+)
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def test_to_dict(benchmark, orm_user):
+    benchmark(orm_user.to_dict, ['password'])
+
+
+def test_to_dicts(benchmark, orm_user):
+    users = [orm_user] * 1000
+
+    benchmark(User.to_dicts, users, ['password'])
+
+
+def test_user_response_model_validate(benchmark, orm_user):
+    benchmark(UserResponse.model_validate, orm_user)
+
+
+def test_login_response_via_to_dict(benchmark, orm_user, loop):
+    async def serialize():
+        content = LoginResponse(
+            message='Login successful!',
+            token=TOKEN,
+            refresh_token=TOKEN,
+            user=UserResponse.model_validate(orm_user.to_dict()),
+        )
+        body = await serialize_response(field=LOGIN_FIELD, response_content=content)
+        return JSONResponse(body).body
+
+    benchmark(lambda: loop.run_until_complete(serialize()))
+
+
+def test_login_response_via_from_attributes(benchmark, orm_user, loop):
+    async def serialize():
+        content = LoginResponse(
+            message='Login successful!',
+            token=TOKEN,
+            refresh_token=TOKEN,
+            user=orm_user,
+        )
+        body = await serialize_response(field=LOGIN_FIELD, response_content=content)
+        return ORJSONResponse(body).body
+
+    benchmark(lambda: loop.run_until_complete(serialize()))
@@ -1,3 +1,24 @@
+import pytest
 from dotenv import load_dotenv
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base_model import BaseModel
+from app.models.refresh_token import RefreshToken  # noqa: F401
+from app.models.user import User  # noqa: F401
 
 load_dotenv()
+
+
+@pytest.fixture
+def session():
+    engine = create_engine(
+        'sqlite://',
+        connect_args={'check_same_thread': False},
+        poolclass=StaticPool,
+    )
+    BaseModel.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        yield session
+    engine.dispose()
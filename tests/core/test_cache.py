@@ -0,0 +1,52 @@
+import pytest
+
+from app.core.cache import LRUCache
+
+
+@pytest.fixture
+def cache():
+    return LRUCache(max_size=2, ttl=60)
+
+
+def test_get_and_set(cache):
+    cache.set('a', 1)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_lru_eviction(cache):
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 'c')
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 'c'
+    assert cache.stats()['evictions'] == 1
+
+
+def test_ttl_expiration(cache, mocker):
+    cache.set('a', 1)
+    mocker.patch('app.core.cache.time.monotonic', return_value=float('inf'))
+
+    assert cache.get('a') is None
+    assert cache.stats()['expirations'] == 1
+    assert cache.stats()['size'] == 0
+
+
+def test_invalidate(cache):
+    cache.set('a', 1)
+    cache.invalidate('a')
+
+    assert cache.get('a') is None
+
+
+def test_disabled_cache():
+    cache = LRUCache(max_size=0)
+    cache.set('a', 1)
+
+    assert cache.get('a') is None
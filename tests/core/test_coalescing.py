@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from app.core.coalescing import BatchLoader, SingleFlight
+
+
+@pytest.fixture
+def anyio_backend():
+    return 'asyncio'
+
+
+@pytest.mark.anyio
+async def test_single_flight_shares_one_execution():
+    single_flight = SingleFlight()
+    executions = 0
+
+    async def fetch():
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.01)
+        return 'user'
+
+    results = await asyncio.gather(
+        *(single_flight.do('id', fetch) for _ in range(20))
+    )
+
+    assert results == ['user'] * 20
+    assert executions == 1
+    assert single_flight.stats() == {
+        'in_flight': 0,
+        'calls': 20,
+        'executions': 1,
+        'coalesced': 19,
+    }
+
+
+@pytest.mark.anyio
+async def test_single_flight_propagates_errors_to_every_caller():
+    single_flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError('database is down')
+
+    results = await asyncio.gather(
+        single_flight.do('id', fail),
+        single_flight.do('id', fail),
+        return_exceptions=True,
+    )
+
+    assert [str(result) for result in results] == ['database is down'] * 2
+
+
+@pytest.mark.anyio
+async def test_batch_loader_groups_keys_in_one_call():
+    calls = []
+
+    async def load_many(keys):
+        calls.append(keys)
+        return {key: key.upper() for key in keys if key != 'missing'}
+
+    loader = BatchLoader(load_many, window=0.01)
+
+    results = await asyncio.gather(
+        loader.load('a'), loader.load('b'), loader.load('a'), loader.load('missing')
+    )
+
+    assert results == ['A', 'B', 'A', None]
+    assert calls == [['a', 'b', 'missing']]
+
+
+@pytest.mark.anyio
+async def test_batch_loader_dispatches_full_batches_immediately():
+    calls = []
+
+    async def load_many(keys):
+        calls.append(keys)
+        return {key: key for key in keys}
+
+    loader = BatchLoader(load_many, window=10, max_batch_size=2)
+
+    results = await asyncio.gather(loader.load(1), loader.load(2))
+
+    assert results == [1, 2]
+    assert calls == [[1, 2]]
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from app.core.json_stream import iter_json_rows
+from app.types.exceptions import InvalidPayloadError
+
+
+@pytest.fixture
+def anyio_backend():
+    return 'asyncio'
+
+
+async def collect(chunks):
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    return [row async for row in iter_json_rows(stream())]
+
+
+@pytest.mark.anyio
+async def test_ndjson_rows():
+    rows = await collect([b'{"a": 1}\n{"a"', b': 2}\n\n{"a": 3}'])
+
+    assert rows == [{'a': 1}, {'a': 2}, {'a': 3}]
+
+
+@pytest.mark.anyio
+async def test_invalid_ndjson_line_is_reported():
+    rows = await collect([b'{"a": 1}\nnot json\n'])
+
+    assert rows[0] == {'a': 1}
+    assert isinstance(rows[1], json.JSONDecodeError)
+
+
+@pytest.mark.anyio
+async def test_json_array_split_across_chunks():
+    body = '[{"name": "João"}, {"name": "Ana"}]'.encode()
+
+    rows = await collect([body[i : i + 5] for i in range(0, len(body), 5)])
+
+    assert rows == [{'name': 'João'}, {'name': 'Ana'}]
+
+
+@pytest.mark.anyio
+async def test_malformed_json_array():
+    with pytest.raises(InvalidPayloadError):
+        await collect([b'[{"a": 1}, {"a": '])
@@ -0,0 +1,39 @@
+import pytest
+
+from app.core.password_pool import PasswordPool
+from app.types.exceptions import ServiceUnavailableError
+
+
+@pytest.fixture(scope='module')
+def pool():
+    pool = PasswordPool(max_workers=1, max_queue=1)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def anyio_backend():
+    return 'asyncio'
+
+
+def test_hash_and_verify_password(pool):
+    hashed_password = pool.hash_password('mysecretpassword')
+
+    assert pool.verify_password('mysecretpassword', hashed_password)
+    assert not pool.verify_password('wrongpassword', hashed_password)
+    assert pool.stats()['avg_execution_ms'] > 0
+
+
+@pytest.mark.anyio
+async def test_async_hash_and_verify_password(pool):
+    hashed_password = await pool.ahash_password('mysecretpassword')
+
+    assert await pool.averify_password('mysecretpassword', hashed_password)
+
+
+def test_saturated_pool_rejects(pool, mocker):
+    mocker.patch.object(pool, '_pending', pool.max_workers + pool.max_queue)
+
+    with pytest.raises(ServiceUnavailableError):
+        pool.hash_password('mysecretpassword')
+    assert pool.stats()['rejected'] == 1
@@ -0,0 +1,66 @@
+import pytest
+
+from app.core.rate_limit import LoginThrottle, MemoryRateLimitBackend
+from app.types.exceptions import ServiceUnavailableError, TooManyRequestsError
+
+WINDOW = 60
+
+
+@pytest.fixture
+def clock(mocker):
+    now = [1000.0]
+    mocker.patch('app.core.rate_limit.time.monotonic', side_effect=lambda: now[0])
+    return now
+
+
+def test_sliding_window_limits_hits(clock):
+    backend = MemoryRateLimitBackend()
+
+    assert [backend.hit('key', 2, WINDOW) for _ in range(2)] == [None, None]
+    assert backend.hit('key', 2, WINDOW) == WINDOW
+
+    clock[0] += WINDOW / 2
+    assert backend.hit('key', 2, WINDOW) == WINDOW / 2
+
+    clock[0] += WINDOW / 2
+    assert backend.hit('key', 2, WINDOW) is None
+
+
+def test_idle_keys_are_swept(clock):
+    backend = MemoryRateLimitBackend()
+    backend.hit('old', 1, 60)
+
+    clock[0] += 61
+    backend.hit('new', 1, 60)
+
+    assert len(backend) == 1
+
+
+def test_throttle_limits_each_email_case_insensitively():
+    throttle = LoginThrottle(MemoryRateLimitBackend(), 60, 0, 1, 0)
+    throttle.check('10.0.0.1', 'user@test.com')
+
+    with pytest.raises(TooManyRequestsError) as error:
+        throttle.check('10.0.0.2', 'USER@test.com ')
+
+    assert error.value.headers == {'Retry-After': '60'}
+    throttle.check('10.0.0.1', 'other@test.com')
+
+
+def test_throttle_limits_each_ip():
+    throttle = LoginThrottle(MemoryRateLimitBackend(), 60, 1, 0, 0)
+    throttle.check('10.0.0.1', 'a@test.com')
+
+    with pytest.raises(TooManyRequestsError):
+        throttle.check('10.0.0.1', 'b@test.com')
+
+
+def test_verification_slots_shed_excess_load():
+    throttle = LoginThrottle(MemoryRateLimitBackend(), 60, 0, 0, 1)
+
+    with throttle.verification_slot(), pytest.raises(ServiceUnavailableError):
+        with throttle.verification_slot():
+            pass
+
+    with throttle.verification_slot():
+        pass
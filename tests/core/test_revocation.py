@@ -0,0 +1,19 @@
+from app.core.revocation import RevocationList
+
+
+def test_revoke_rejects_older_versions():
+    revocations = RevocationList(ttl=60)
+    revocations.revoke('user-id', 2)
+
+    assert revocations.is_revoked('user-id', 1)
+    assert not revocations.is_revoked('user-id', 2)
+    assert not revocations.is_revoked('other-id', 0)
+
+
+def test_revocation_expires(mocker):
+    revocations = RevocationList(ttl=60)
+    revocations.revoke('user-id', 2)
+    mocker.patch('app.core.revocation.time.monotonic', return_value=float('inf'))
+
+    assert not revocations.is_revoked('user-id', 1)
+    assert len(revocations) == 0
@@ -1,6 +1,7 @@
 import pytest
 
 from app.core.security import SecurityManager
+from app.core.settings import override_settings
 from app.types.exceptions import ExpiredSignatureError, InvalidTokenError
 
 
@@ -49,3 +50,49 @@ def test_verify_password(security_manager):
 
     assert security_manager.verify_password(password, hashed_password)
     assert not security_manager.verify_password(incorrect_password, hashed_password)
+
+
+def test_verify_and_update_rehashes_outdated_hash():
+    with override_settings(BCRYPT_ROUNDS=4):
+        outdated_hash = SecurityManager().hash_password('mysecretpassword')
+    with override_settings(BCRYPT_ROUNDS=5):
+        security_manager = SecurityManager()
+        verified, new_hash = security_manager.verify_and_update(
+            'mysecretpassword', outdated_hash
+        )
+
+    assert verified
+    assert new_hash.startswith('$2b$05$')
+    assert not security_manager.needs_update(new_hash)
+
+
+def test_verify_and_update_keeps_current_hash(security_manager):
+    hashed_password = security_manager.hash_password('mysecretpassword')
+
+    assert security_manager.verify_and_update(
+        'mysecretpassword', hashed_password
+    ) == (True, None)
+    assert security_manager.verify_and_update('wrongpassword', hashed_password) == (
+        False,
+        None,
+    )
+
+
+def test_verify_access_token_uses_cache(security_manager):
+    token = security_manager.create_access_token({'sub': 'test_user'})
+
+    first = security_manager.verify_access_token(token)
+    second = security_manager.verify_access_token(token)
+
+    assert first == second
+    assert security_manager.token_cache.stats()['hits'] == 1
+
+
+def test_cached_token_expiration(security_manager, mocker):
+    token = security_manager.create_access_token({'sub': 'test_user'})
+    security_manager.verify_access_token(token)
+    mocker.patch('app.core.security.time.time', return_value=float('inf'))
+
+    with pytest.raises(ExpiredSignatureError):
+        security_manager.verify_access_token(token)
+    assert security_manager.token_cache.stats()['size'] == 0
@@ -3,7 +3,13 @@ import os
 
 import pytest
 
-from app.core.settings import InterceptHandler, Settings
+from app.core.settings import (
+    InterceptHandler,
+    Settings,
+    get_settings,
+    override_settings,
+    reset_settings,
+)
 
 
 def test_settings(mocker):
@@ -24,6 +30,31 @@ def test_settings(mocker):
     assert settings.ALGORITHM == 'test_algorithm'
 
 
+def test_get_settings_is_cached():
+    assert get_settings() is get_settings()
+
+
+def test_override_settings():
+    original = get_settings()
+
+    with override_settings(PROJECT_NAME='overridden') as settings:
+        assert get_settings() is settings
+        assert get_settings().PROJECT_NAME == 'overridden'
+
+    assert get_settings() is original
+
+
+def test_reset_settings(mocker):
+    original = get_settings()
+    mocker.patch.dict(os.environ, {'PROJECT_NAME': 'reloaded'})
+
+    reset_settings()
+
+    assert get_settings() is not original
+    assert get_settings().PROJECT_NAME == 'reloaded'
+    reset_settings()
+
+
 @pytest.fixture
 def log_handler():
     handler = InterceptHandler()
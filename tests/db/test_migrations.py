@@ -0,0 +1,52 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.settings import override_settings
+from app.db.database import run_migrations
+from app.db.migration_lock import file_lock
+
+
+@pytest.fixture
+def migration_state(mocker, tmp_path):
+    state = {'revision': 'a1'}
+
+    def upgrade(*_):
+        time.sleep(0.1)
+        state['revision'] = 'b2'
+
+    mocker.patch('app.db.database.head_revision', return_value='b2')
+    mocker.patch(
+        'app.db.database.current_revision', side_effect=lambda _: state['revision']
+    )
+    state['upgrade'] = mocker.patch('alembic.command.upgrade', side_effect=upgrade)
+    with override_settings(MIGRATION_LOCK_FILE=str(tmp_path / 'migrations.lock')):
+        yield state
+
+
+def test_file_lock_is_exclusive(tmp_path):
+    path = tmp_path / 'migrations.lock'
+    with file_lock(path, timeout=1), pytest.raises(TimeoutError):
+        with file_lock(path, timeout=0.2):
+            pass
+
+    with file_lock(path, timeout=0.2):
+        pass
+
+
+def test_run_migrations_skips_database_at_head(migration_state):
+    migration_state['revision'] = 'b2'
+
+    run_migrations()
+
+    migration_state['upgrade'].assert_not_called()
+
+
+def test_only_one_worker_runs_migrations(migration_state):
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for future in [executor.submit(run_migrations) for _ in range(4)]:
+            future.result()
+
+    assert migration_state['upgrade'].call_count == 1
+    assert migration_state['revision'] == 'b2'
@@ -0,0 +1,41 @@
+import pytest
+from sqlalchemy import create_engine, exc
+
+from app.core.settings import override_settings
+from app.db.pool import InstrumentedQueuePool, engine_pool_options
+
+
+@pytest.fixture
+def engine(tmp_path):
+    url = f'sqlite:///{tmp_path / "pool.db"}'
+    with override_settings(DB_POOL_SIZE=1, DB_MAX_OVERFLOW=0, DB_POOL_TIMEOUT=0.05):
+        engine = create_engine(url, **engine_pool_options(url))
+    yield engine
+    engine.dispose()
+
+
+def test_memory_database_keeps_default_pool():
+    assert engine_pool_options('sqlite://') == {}
+
+
+def test_pool_options_from_settings(engine):
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+    assert engine.pool.size() == 1
+
+
+def test_pool_stats_track_checkouts(engine):
+    with engine.connect():
+        stats = engine.pool.stats()
+    with engine.connect():
+        pass
+
+    assert stats['checked_out'] == 1
+    assert engine.pool.stats()['checkouts'] == stats['checkouts'] + 1
+    assert engine.pool.stats()['checked_out'] == 0
+
+
+def test_pool_stats_track_timeouts(engine):
+    with engine.connect(), pytest.raises(exc.TimeoutError):
+        engine.connect()
+
+    assert engine.pool.stats()['timeouts'] == 1
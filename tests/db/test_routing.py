@@ -0,0 +1,90 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.routing import (
+    LeastConnectionsSelector,
+    RoundRobinSelector,
+    RoutingSession,
+    routing_options,
+)
+from app.models.base_model import BaseModel
+from app.models.user import User
+from app.repositories.user_repositorie import UserRepository
+from app.types.schemas import UserPayload
+
+
+@pytest.fixture
+def engines(tmp_path):
+    primary = create_engine(f'sqlite:///{tmp_path / "primary.db"}')
+    replica = create_engine(f'sqlite:///{tmp_path / "replica.db"}')
+    for engine in (primary, replica):
+        BaseModel.metadata.create_all(engine)
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+@pytest.fixture
+def session_factory(engines):
+    primary, replica = engines
+    return sessionmaker(bind=primary, **routing_options([replica]))
+
+
+def add_user(engine, email: str) -> None:
+    with Session(engine) as session:
+        session.add(
+            User(
+                full_name='User',
+                password='hash',
+                email=email,
+                registration_number=email,
+            )
+        )
+        session.commit()
+
+
+def test_reads_go_to_replica(engines, session_factory):
+    add_user(engines[1], 'replica@test.com')
+
+    with session_factory() as session:
+        user = UserRepository(session).get_user_by_email('replica@test.com')
+
+    assert isinstance(session, RoutingSession)
+    assert user is not None
+
+
+def test_writes_go_to_primary(engines, session_factory, mocker):
+    mocker.patch(
+        'app.repositories.user_repositorie.password_pool.hash_password',
+        return_value='hash',
+    )
+    payload = UserPayload(
+        full_name='New User',
+        email='new@test.com',
+        password='secret',
+        registration_number='456',
+    )
+
+    with session_factory() as session:
+        UserRepository(session).create_user(payload)
+        # Depois da escrita a sessão lê do primário
+        assert UserRepository(session).get_user_by_email('new@test.com') is not None
+
+    for engine, expected in zip(engines, [1, 0]):
+        with Session(engine) as session:
+            assert session.query(User).count() == expected
+
+
+def test_round_robin_selector():
+    selector = RoundRobinSelector()
+    replicas = ['a', 'b', 'c']
+
+    assert [selector.select(replicas) for _ in range(4)] == ['a', 'b', 'c', 'a']
+
+
+def test_least_connections_selector(engines):
+    busy, idle = engines
+
+    with busy.connect():
+        assert LeastConnectionsSelector.select([busy, idle]) is idle
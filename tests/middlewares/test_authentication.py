@@ -0,0 +1,201 @@
+import asyncio
+import time
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request, status
+from fastapi.testclient import TestClient
+
+from app.core.cache import principal_cache
+from app.core.revocation import revocation_list
+from app.core.security import security
+from app.core.settings import override_settings
+from app.middlewares.authentication import AuthenticationMiddleware
+from app.models.user import User
+
+mock_user = User(id=str(uuid4()), full_name='Regular User', role='User')
+
+
+@pytest.fixture
+def anyio_backend():
+    return 'asyncio'
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+    app.add_middleware(AuthenticationMiddleware)
+
+    @app.get('/api/me')
+    def me(request: Request):
+        return {'username': request.state.user.full_name}
+
+    @app.get('/api/role')
+    def role(request: Request):
+        return {'role': request.state.user.role}
+
+    @app.post('/api/login')
+    def login():
+        return {'message': 'Login route accessed'}
+
+    principal_cache.clear()
+    yield app
+    principal_cache.clear()
+
+
+@pytest.fixture
+def client(app):
+    return TestClient(app)
+
+
+@pytest.fixture
+def token():
+    return security.create_access_token({'user_id': mock_user.id})
+
+
+def test_authenticated_request(client, token, mocker):
+    load_user = mocker.patch.object(
+        AuthenticationMiddleware, '_load_user', return_value=mock_user
+    )
+
+    response = client.get('/api/me', headers={'Authorization': f'Bearer {token}'})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {'username': 'Regular User'}
+    load_user.assert_called_once_with(mock_user.id)
+
+
+def test_cached_principal_skips_lookup(client, token, mocker):
+    load_user = mocker.patch.object(
+        AuthenticationMiddleware, '_load_user', return_value=mock_user
+    )
+
+    for _ in range(3):
+        client.get('/api/me', headers={'Authorization': f'Bearer {token}'})
+
+    load_user.assert_called_once()
+
+
+def test_login_route_bypasses_authentication(client):
+    response = client.post('/api/login')
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_missing_token(client):
+    response = client.get('/api/me')
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json() == {'detail': 'Authentication token is missing'}
+
+
+def test_invalid_token(client):
+    response = client.get('/api/me', headers={'Authorization': 'Bearer invalid'})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json() == {
+        'detail': 'Invalid token, please re-authenticate again.'
+    }
+
+
+def test_unknown_user(client, token, mocker):
+    mocker.patch.object(AuthenticationMiddleware, '_load_user', return_value=None)
+
+    response = client.get('/api/me', headers={'Authorization': f'Bearer {token}'})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json() == {
+        'detail': 'Invalid token, please re-authenticate again.'
+    }
+
+
+def test_outdated_token_version(client, token, mocker):
+    outdated_user = User(id=mock_user.id, role='User', token_version=1)
+    mocker.patch.object(
+        AuthenticationMiddleware, '_load_user', return_value=outdated_user
+    )
+
+    response = client.get('/api/me', headers={'Authorization': f'Bearer {token}'})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_revoked_token(client, token, mocker):
+    load_user = mocker.patch.object(
+        AuthenticationMiddleware, '_load_user', return_value=mock_user
+    )
+    mocker.patch.object(revocation_list, '_entries', {})
+    revocation_list.revoke(mock_user.id, 1)
+
+    response = client.get('/api/me', headers={'Authorization': f'Bearer {token}'})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    load_user.assert_not_called()
+
+
+def test_stateless_principal_from_claims(client, mocker):
+    load_user = mocker.patch.object(AuthenticationMiddleware, '_load_user')
+    token = security.create_access_token({
+        'user_id': mock_user.id,
+        'user_role': 'Editor',
+        'token_version': 0,
+    })
+
+    with override_settings(AUTH_STATELESS=True):
+        response = client.get(
+            '/api/role', headers={'Authorization': f'Bearer {token}'}
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {'role': 'Editor'}
+    load_user.assert_not_called()
+
+
+async def get_concurrently(app: FastAPI, tokens: list[str]) -> list[httpx.Response]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://test'
+    ) as client:
+        return await asyncio.gather(
+            *(
+                client.get('/api/me', headers={'Authorization': f'Bearer {token}'})
+                for token in tokens
+            )
+        )
+
+
+@pytest.mark.anyio
+async def test_concurrent_lookups_share_one_query(app, token, mocker):
+    def slow_load_user(_):
+        time.sleep(0.05)
+        return mock_user
+
+    load_user = mocker.patch.object(
+        AuthenticationMiddleware, '_load_user', side_effect=slow_load_user
+    )
+
+    responses = await get_concurrently(app, [token] * 20)
+
+    assert all(response.status_code == status.HTTP_200_OK for response in responses)
+    load_user.assert_called_once_with(mock_user.id)
+
+
+@pytest.mark.anyio
+async def test_lookups_for_distinct_users_are_batched(app, mocker):
+    users = [User(id=str(uuid4()), full_name='User', role='User') for _ in range(5)]
+    load_users = mocker.patch.object(
+        AuthenticationMiddleware, '_load_users', return_value=users
+    )
+    tokens = [
+        security.create_access_token({'user_id': user_id})
+        for user_id in [*(user.id for user in users), 'not-a-uuid']
+    ]
+
+    with override_settings(AUTH_BATCH_WINDOW_MS=20):
+        responses = await get_concurrently(app, tokens)
+
+    assert [response.status_code for response in responses[:5]] == [200] * 5
+    assert responses[5].status_code == status.HTTP_401_UNAUTHORIZED
+    load_users.assert_called_once()
+    assert sorted(load_users.call_args.args[0]) == sorted(user.id for user in users)
@@ -0,0 +1,77 @@
+import pytest
+from fastapi import FastAPI, status
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.middlewares.erro_handling import create_exception_handler
+from app.middlewares.metrics import MetricsMiddleware
+from app.types.exceptions import PermissionDeniedError
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+
+    @app.get('/api/items/{item_id}')
+    def item(item_id: int):
+        return {'id': item_id}
+
+    @app.get('/api/forbidden')
+    def forbidden():
+        raise PermissionDeniedError('Nope')
+
+    app.add_exception_handler(
+        PermissionDeniedError,
+        create_exception_handler(status.HTTP_403_FORBIDDEN, 'Permission denied'),
+    )
+    return app
+
+
+def test_requests_labelled_by_route_template(app):
+    app.add_middleware(MetricsMiddleware)
+    labels = {'method': 'GET', 'route': '/api/items/{item_id}', 'status': '200'}
+    before = sample('http_requests_total', **labels)
+
+    TestClient(app).get('/api/items/1')
+    TestClient(app).get('/api/items/2')
+
+    assert sample('http_requests_total', **labels) == before + 2
+    assert sample('http_request_duration_seconds_count', **labels) >= before + 2
+    assert sample('http_requests_in_flight', method='GET') == 0
+
+
+class RejectMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    @staticmethod
+    async def __call__(scope, receive, send):
+        response = PlainTextResponse('', status_code=status.HTTP_401_UNAUTHORIZED)
+        await response(scope, receive, send)
+
+
+def test_rejected_before_routing_uses_route_template(app):
+    app.add_middleware(RejectMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    labels = {'method': 'GET', 'route': '/api/items/{item_id}', 'status': '401'}
+    before = sample('http_requests_total', **labels)
+
+    TestClient(app).get('/api/items/1')
+
+    assert sample('http_requests_total', **labels) == before + 1
+
+
+def test_handled_exceptions_are_counted(app):
+    before = sample('api_exceptions_total', exception='PermissionDeniedError')
+
+    response = TestClient(app).get('/api/forbidden')
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert sample('api_exceptions_total', exception='PermissionDeniedError') == (
+        before + 1
+    )
@@ -0,0 +1,66 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.core.settings import override_settings
+from app.db.profiler import instrument
+from app.middlewares.query_profiler import QueryProfilerMiddleware
+
+
+@pytest.fixture
+def client():
+    engine = create_engine(
+        'sqlite://',
+        connect_args={'check_same_thread': False},
+        poolclass=StaticPool,
+    )
+    app = FastAPI()
+    app.add_middleware(QueryProfilerMiddleware)
+
+    @app.get('/api/users/{count}')
+    def users(count: int):
+        with engine.connect() as connection:
+            for user_id in range(count):
+                connection.execute(text('SELECT :id'), {'id': user_id})
+        return {}
+
+    with override_settings(LOCAL_ENV=True, SLOW_QUERY_MS=0):
+        instrument(engine)
+        yield TestClient(app)
+    engine.dispose()
+
+
+def test_server_timing_header(client):
+    response = client.get('/api/users/2')
+
+    assert response.headers['Server-Timing'].startswith('db;dur=')
+    assert response.headers['Server-Timing'].endswith('desc="2 queries"')
+
+
+def test_repeated_statements_are_flagged(client, mocker):
+    logger = mocker.patch('app.middlewares.query_profiler.logger')
+
+    client.get('/api/users/3')
+
+    logger.warning.assert_called_once()
+    assert 'GET /api/users/{count}' in logger.warning.call_args.args[0]
+
+
+def test_slow_queries_are_logged_with_route(client, mocker):
+    logger = mocker.patch('app.db.profiler.logger')
+
+    client.get('/api/users/1')
+
+    assert 'on GET /api/users/{count}' in logger.warning.call_args.args[0]
+
+
+def test_server_timing_disabled_in_production():
+    app = FastAPI()
+    app.add_middleware(QueryProfilerMiddleware)
+
+    with override_settings(LOCAL_ENV=False):
+        response = TestClient(app).get('/')
+
+    assert 'Server-Timing' not in response.headers
@@ -34,3 +34,26 @@ def test_to_dict_exclude():
     assert 'created_at' not in result
     expected_subset = {'id': str(test_uuid), 'full_name': 'User Test'}
     assert expected_subset.items() <= result.items()
+
+
+def test_to_dict_reuses_class_serializer():
+    user = User(id=uuid4(), full_name='User Test')
+
+    user.to_dict(exclude=['password'])
+    user.to_dict(exclude=['password'])
+
+    assert User._serializer(['password']) is User._serializer({'password'})
+
+
+def test_to_dicts():
+    users = [
+        User(id=uuid4(), full_name='User 1', created_at=datetime(2024, 3, 25)),
+        User(id=uuid4(), full_name='User 2', created_at=None),
+    ]
+
+    result = User.to_dicts(users, exclude=['password'])
+
+    assert result == [user.to_dict(exclude=['password']) for user in users]
+    assert result[0]['created_at'] == '2024-03-25T00:00:00'
+    assert result[1]['created_at'] is None
+    assert all(isinstance(row['id'], str) for row in result)
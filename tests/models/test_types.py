@@ -0,0 +1,52 @@
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+
+from app.models.types import uuid7
+from app.models.user import User
+
+UUID_V7 = 7
+
+
+def test_uuid7_is_time_ordered():
+    ids = [uuid7() for _ in range(100)]
+
+    assert all(value.version == UUID_V7 for value in ids)
+    assert [value.bytes[:6] for value in ids] == sorted(
+        value.bytes[:6] for value in ids
+    )
+
+
+def test_binary_uuid_round_trip(session):
+    user_id = uuid4()
+    session.add(
+        User(
+            id=user_id,
+            full_name='User Test',
+            password='hash',
+            email='user@test.com',
+            registration_number='123',
+        )
+    )
+    session.commit()
+    session.expunge_all()
+
+    stored = session.execute(text('SELECT id FROM users')).scalar_one()
+    user = session.get(User, str(user_id))
+
+    assert stored == user_id.bytes
+    assert isinstance(user.id, UUID)
+    assert user.id == user_id
+
+
+def test_generated_user_id(session):
+    user = User(
+        full_name='User Test',
+        password='hash',
+        email='user@test.com',
+        registration_number='123',
+    )
+    session.add(user)
+    session.commit()
+
+    assert isinstance(user.id, UUID)
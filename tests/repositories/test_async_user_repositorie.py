@@ -0,0 +1,70 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.models.base_model import BaseModel
+from app.models.user import User
+from app.repositories.async_user_repositorie import AsyncUserRepository
+
+
+@pytest.fixture
+def anyio_backend():
+    return 'asyncio'
+
+
+@pytest.fixture
+async def async_session():
+    engine = create_async_engine('sqlite+aiosqlite://', poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(BaseModel.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db_user(async_session):
+    user = User(
+        id=uuid4(),
+        full_name='User Test',
+        password='hash',
+        email='user@test.com',
+        registration_number='123',
+    )
+    async_session.add(user)
+    await async_session.commit()
+    return user
+
+
+@pytest.mark.anyio
+async def test_get_user_by_id(async_session, db_user):
+    user = await AsyncUserRepository(async_session).get_user_by_id(db_user.id)
+
+    assert user.email == 'user@test.com'
+
+
+@pytest.mark.anyio
+async def test_malformed_user_id_is_not_found(async_session, db_user):
+    repo = AsyncUserRepository(async_session)
+
+    assert await repo.get_user_by_id('not-a-uuid') is None
+    assert await repo.get_users_by_ids(['not-a-uuid', str(db_user.id)]) == [db_user]
+
+
+@pytest.mark.anyio
+async def test_get_user_by_email(async_session, db_user):
+    repo = AsyncUserRepository(async_session)
+
+    assert (await repo.get_user_by_email('user@test.com')).id == db_user.id
+    assert await repo.get_user_by_email('other@test.com') is None
+
+
+@pytest.mark.anyio
+async def test_get_user_by_registration_number(async_session, db_user):
+    user = await AsyncUserRepository(async_session).get_user_by_registration_number(
+        '123'
+    )
+
+    assert user.id == db_user.id
@@ -0,0 +1,71 @@
+from uuid import uuid4
+
+from app.core.cache import principal_cache
+from app.core.revocation import revocation_list
+from app.models.user import User
+from app.repositories.user_repositorie import UserRepository
+
+
+def test_get_user_by_id(session):
+    user_id = str(uuid4())
+    session.add(
+        User(
+            id=user_id,
+            full_name='User Test',
+            password='hash',
+            email='user@test.com',
+            registration_number='123',
+        )
+    )
+    session.commit()
+
+    user = UserRepository(session).get_user_by_id(user_id)
+
+    assert user.email == 'user@test.com'
+
+
+def test_malformed_user_id_is_not_found(session):
+    repo = UserRepository(session)
+
+    assert repo.get_user_by_id('not-a-uuid') is None
+    assert repo.get_users_by_ids(['not-a-uuid']) == []
+
+
+def test_commit_invalidates_principal_cache(session):
+    user_id = str(uuid4())
+    user = User(
+        id=user_id,
+        full_name='User Test',
+        password='hash',
+        email='user@test.com',
+        registration_number='123',
+    )
+    session.add(user)
+    session.commit()
+    principal_cache.set(user_id, user)
+
+    user.role = 'Admin'
+    session.commit()
+
+    assert principal_cache.get(user_id) is None
+
+
+def test_role_change_revokes_previous_tokens(session, mocker):
+    mocker.patch.object(revocation_list, '_entries', {})
+    user_id = str(uuid4())
+    user = User(
+        id=user_id,
+        full_name='User Test',
+        password='hash',
+        email='user@test.com',
+        registration_number='123',
+    )
+    session.add(user)
+    session.commit()
+
+    user.role = 'Admin'
+    session.commit()
+
+    assert user.token_version == 1
+    assert revocation_list.is_revoked(user_id, 0)
+    assert not revocation_list.is_revoked(user_id, 1)
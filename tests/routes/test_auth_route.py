@@ -0,0 +1,56 @@
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from app.core.rate_limit import LoginThrottle, MemoryRateLimitBackend
+from app.db.database import get_session
+from app.middlewares.erro_handling import create_exception_handler
+from app.models.user import User
+from app.routes.auth_route import router
+from app.types.exceptions import TooManyRequestsError
+
+WINDOW = 60
+
+
+@pytest.fixture
+def client(session, mocker):
+    session.add(
+        User(
+            id=uuid4(),
+            full_name='User Test',
+            password='hash',
+            email='user@test.com',
+            registration_number='1',
+        )
+    )
+    session.commit()
+    mocker.patch(
+        'app.services.auth_service.login_throttle',
+        LoginThrottle(MemoryRateLimitBackend(), WINDOW, 1, 0, 0),
+    )
+    mocker.patch(
+        'app.services.auth_service.password_pool.verify_and_update',
+        return_value=(True, None),
+    )
+    app = FastAPI()
+    app.include_router(router, prefix='/api')
+    app.add_exception_handler(
+        TooManyRequestsError,
+        create_exception_handler(
+            status.HTTP_429_TOO_MANY_REQUESTS, 'Too many requests'
+        ),
+    )
+    app.dependency_overrides[get_session] = lambda: session
+    return TestClient(app)
+
+
+def test_throttled_login_returns_429_with_retry_after(client):
+    payload = {'email': 'user@test.com', 'password': 'secret'}
+
+    assert client.post('/api/login', json=payload).status_code == status.HTTP_200_OK
+    response = client.post('/api/login', json=payload)
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert 0 < int(response.headers['Retry-After']) <= WINDOW
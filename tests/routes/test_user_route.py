@@ -0,0 +1,165 @@
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.core.settings import override_settings
+from app.db.database import get_session
+from app.middlewares.check_roles import get_current_user
+from app.models.user import User
+from app.routes.user_route import router
+from app.types.exceptions import InvalidPayloadError
+from app.types.principal import Principal
+
+
+@pytest.fixture
+def user():
+    return User(
+        id=uuid4(),
+        full_name='User Test',
+        password='hash',
+        email='user@test.com',
+        registration_number='1',
+        role='User',
+        created_at=datetime(2024, 3, 25, 12, 0, 0),
+        updated_at=datetime(2024, 3, 25, 12, 0, 0),
+    )
+
+
+@pytest.fixture
+def app(session, user):
+    app = FastAPI()
+    app.include_router(router, prefix='/api')
+    app.dependency_overrides[get_current_user] = lambda: user
+    app.dependency_overrides[get_session] = lambda: session
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return TestClient(app)
+
+
+def test_me_returns_current_user_with_etag(client, user, mocker):
+    query = mocker.patch('app.middlewares.check_roles.UserRepository')
+
+    response = client.get('/api/user/me')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['email'] == 'user@test.com'
+    assert response.headers['ETag'].startswith('"')
+    query.assert_not_called()
+
+
+def test_me_honors_if_none_match(client):
+    etag = client.get('/api/user/me').headers['ETag']
+
+    response = client.get(
+        '/api/user/me', headers={'If-None-Match': f'"other", W/{etag}'}
+    )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers['ETag'] == etag
+    assert not response.content
+
+
+def test_me_etag_changes_with_updated_at(client, user):
+    etag = client.get('/api/user/me').headers['ETag']
+    user.updated_at = datetime(2024, 3, 26, 12, 0, 0)
+
+    response = client.get('/api/user/me', headers={'If-None-Match': etag})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['ETag'] != etag
+
+
+def test_me_etag_changes_within_the_same_second(client, user):
+    etag = client.get('/api/user/me').headers['ETag']
+    user.full_name = 'Renamed User'
+
+    response = client.get('/api/user/me', headers={'If-None-Match': etag})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['ETag'] != etag
+
+
+def test_me_loads_row_for_stateless_principal(app, session, user):
+    session.add(user)
+    session.commit()
+    app.dependency_overrides[get_current_user] = lambda: Principal(
+        id=str(user.id), role='User'
+    )
+
+    response = TestClient(app).get('/api/user/me')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['id'] == str(user.id)
+
+
+def test_bulk_reports_committed_chunks_on_malformed_array(
+    client, user, session, mocker
+):
+    user.role = 'Admin'
+    mocker.patch(
+        'app.services.user_service.password_pool.hash_passwords',
+        side_effect=lambda passwords: ['hash'] * len(passwords),
+    )
+    rows = [
+        {
+            'full_name': 'Bulk User',
+            'email': f'bulk{index}@test.com',
+            'password': 'secret',
+            'registration_number': f'b{index}',
+        }
+        for index in range(3)
+    ]
+    body = '[' + ', '.join(json.dumps(row) for row in rows) + ', {"email"'
+
+    with override_settings(BULK_REGISTER_CHUNK_SIZE=2):
+        response = client.post('/api/user/register/bulk', content=body)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [result['status'] for result in response.json()['results']] == [
+        'created',
+        'created',
+        'invalid',
+        'invalid',
+    ]
+    assert session.query(User).count() == len(rows) - 1
+
+
+def test_bulk_rejects_malformed_array_before_any_commit(client, user, session):
+    user.role = 'Admin'
+
+    with pytest.raises(InvalidPayloadError):
+        client.post('/api/user/register/bulk', content='[{"email"')
+
+    assert session.query(User).count() == 0
+
+
+@pytest.mark.parametrize('export_format', ['csv', 'ndjson'])
+def test_export_omits_internal_columns(client, user, session, mocker, export_format):
+    session.add(user)
+    session.commit()
+    user.role = 'Admin'
+    mocker.patch(
+        'app.routes.user_route.SessionLocal',
+        sessionmaker(bind=session.get_bind()),
+    )
+
+    response = client.get('/api/user/export', params={'format': export_format})
+
+    assert response.status_code == status.HTTP_200_OK
+    first_line = response.text.splitlines()[0]
+    columns = (
+        first_line.split(',')
+        if export_format == 'csv'
+        else list(json.loads(first_line))
+    )
+    assert 'email' in columns
+    assert 'password' not in columns
+    assert 'token_version' not in columns
@@ -0,0 +1,92 @@
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.core.rate_limit import LoginThrottle, MemoryRateLimitBackend
+from app.core.security import security
+from app.models.user import User
+from app.services.auth_service import AuthService, utc_now
+from app.types.exceptions import (
+    InvalidCredentialsError,
+    InvalidTokenError,
+    TooManyRequestsError,
+)
+from app.types.schemas import LoginPayload
+
+ATTEMPTS_PER_EMAIL = 2
+
+
+@pytest.fixture
+def login_setup(session, mocker):
+    session.add(
+        User(
+            id=uuid4(),
+            full_name='User Test',
+            password='hash',
+            email='user@test.com',
+            registration_number='1',
+        )
+    )
+    session.commit()
+    mocker.patch(
+        'app.services.auth_service.login_throttle',
+        LoginThrottle(MemoryRateLimitBackend(), 60, 0, ATTEMPTS_PER_EMAIL, 0),
+    )
+    return mocker.patch(
+        'app.services.auth_service.password_pool.verify_and_update',
+        return_value=(False, None),
+    )
+
+
+def test_throttled_login_skips_password_verification(session, login_setup):
+    service = AuthService(session)
+    payload = LoginPayload(email='user@test.com', password='wrong')
+
+    for _ in range(ATTEMPTS_PER_EMAIL):
+        with pytest.raises(InvalidCredentialsError):
+            service.login(payload, '10.0.0.1')
+    with pytest.raises(TooManyRequestsError):
+        service.login(payload, '10.0.0.1')
+
+    assert login_setup.call_count == ATTEMPTS_PER_EMAIL
+
+
+def login(service: AuthService, verify) -> tuple[str, str, User]:
+    verify.return_value = (True, None)
+    return service.login(LoginPayload(email='user@test.com', password='secret'))
+
+
+def test_refresh_rotates_token_without_password_check(session, login_setup):
+    service = AuthService(session)
+    _, refresh_token, _ = login(service, login_setup)
+
+    access_token, new_refresh_token = service.refresh(refresh_token)
+
+    assert security.verify_access_token(access_token)['user_role'] == 'User'
+    login_setup.assert_called_once()
+    with pytest.raises(InvalidTokenError):
+        service.refresh(refresh_token)
+    service.refresh(new_refresh_token)
+
+
+def test_expired_refresh_token_is_rejected(session, login_setup, mocker):
+    service = AuthService(session)
+    _, refresh_token, _ = login(service, login_setup)
+    mocker.patch(
+        'app.services.auth_service.utc_now',
+        return_value=utc_now() + timedelta(days=31),
+    )
+
+    with pytest.raises(InvalidTokenError):
+        service.refresh(refresh_token)
+
+
+def test_logout_revokes_refresh_tokens(session, login_setup):
+    service = AuthService(session)
+    _, refresh_token, user = login(service, login_setup)
+
+    service.logout(str(user.id))
+
+    with pytest.raises(InvalidTokenError):
+        service.refresh(refresh_token)
@@ -0,0 +1,151 @@
+import json
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.core.settings import override_settings
+from app.models.user import User
+from app.services.user_service import UserService
+from app.types.exceptions import DataConflictError, InvalidPayloadError
+from app.types.schemas import UserFilters, UserPayload
+
+
+@pytest.fixture
+def service(session, mocker):
+    mocker.patch(
+        'app.services.user_service.password_pool.hash_passwords',
+        side_effect=lambda passwords: [f'hashed-{p}' for p in passwords],
+    )
+    session.add(
+        User(
+            id=uuid4(),
+            full_name='Existing User',
+            password='hash',
+            email='existing@test.com',
+            registration_number='1',
+        )
+    )
+    session.commit()
+    return UserService(session)
+
+
+def new_user(email, registration_number):
+    return {
+        'full_name': 'User Test',
+        'email': email,
+        'password': 'secret',
+        'registration_number': registration_number,
+    }
+
+
+@pytest.mark.parametrize(
+    ('email', 'registration_number', 'message'),
+    [
+        ('existing@test.com', '2', 'Email alredy in use.'),
+        ('other@test.com', '1', 'Registration number alredy in use.'),
+    ],
+)
+def test_user_register_conflict(service, email, registration_number, message):
+    payload = UserPayload.model_validate(new_user(email, registration_number))
+
+    with pytest.raises(DataConflictError) as error:
+        service.user_register(payload)
+
+    assert error.value.message == message
+
+
+def test_bulk_register(service, session):
+    results = service.bulk_register([
+        (0, new_user('a@test.com', '10')),
+        (1, new_user('existing@test.com', '11')),
+        (2, new_user('b@test.com', '1')),
+        (3, new_user('a@test.com', '12')),
+        (4, {'email': 'c@test.com'}),
+    ])
+
+    assert [result.status for result in results] == [
+        'created',
+        'conflict',
+        'conflict',
+        'conflict',
+        'invalid',
+    ]
+    assert results[1].detail == 'Email alredy in use.'
+    assert results[2].detail == 'Registration number alredy in use.'
+    created = session.get(User, str(results[0].id))
+    assert created.password == 'hashed-secret'
+    assert created.role == 'User'
+
+
+@pytest.fixture
+def listed_users(session):
+    start = datetime(2025, 1, 1)
+    users = [
+        User(
+            id=uuid4(),
+            full_name=f'User {i}',
+            password='hash',
+            email=f'user{i}@{"staff" if i % 2 else "test"}.com',
+            registration_number=f'r{i}',
+            role='Editor' if i % 2 else 'User',
+            created_at=start + timedelta(days=i // 2),
+        )
+        for i in range(5)
+    ]
+    session.add_all(users)
+    session.commit()
+    return users
+
+
+def test_list_users_keyset_pagination(service, listed_users):
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = service.list_users(2, cursor, UserFilters())
+        seen += [user.full_name for user in page]
+        if cursor is None:
+            break
+
+    assert seen[0] == 'Existing User'
+    assert seen[1:] == [
+        user.full_name
+        for user in sorted(
+            listed_users, key=lambda u: (u.created_at, u.id), reverse=True
+        )
+    ]
+
+
+def test_list_users_filters(service, listed_users):
+    editors, _ = service.list_users(10, None, UserFilters(role='Editor'))
+    staff, _ = service.list_users(10, None, UserFilters(email_prefix='user1@'))
+
+    assert {user.full_name for user in editors} == {'User 1', 'User 3'}
+    assert [user.full_name for user in staff] == ['User 1']
+
+
+def test_list_users_invalid_cursor(service):
+    with pytest.raises(InvalidPayloadError):
+        service.list_users(10, 'not-a-cursor', UserFilters())
+
+
+def test_export_users_csv(service, listed_users):
+    with override_settings(EXPORT_BATCH_SIZE=2):
+        chunks = list(service.export_users('csv', ['created_at', 'updated_at']))
+    rows = ''.join(chunks).splitlines()
+
+    assert [len(chunk.splitlines()) for chunk in chunks] == [3, 2, 2]
+    assert rows[0] == 'id,full_name,email,registration_number,role'
+    assert len(rows) == len(listed_users) + 2
+    assert 'hash' not in ''.join(chunks)
+
+
+def test_export_users_ndjson(service, listed_users):
+    lines = ''.join(service.export_users('ndjson', [])).splitlines()
+    rows = [json.loads(line) for line in lines]
+
+    assert len(rows) == len(listed_users) + 1
+    assert all('password' not in row for row in rows)
+    assert {row['full_name'] for row in rows} >= {
+        user.full_name for user in listed_users
+    }
@@ -0,0 +1,34 @@
+from datetime import datetime
+from uuid import uuid4
+
+from app.models.user import User
+from app.types.schemas import LoginResponse, UserResponse
+
+
+def test_user_response_from_orm_user():
+    user_id = uuid4()
+    user = User(
+        id=str(user_id),
+        full_name='User Test',
+        email='user@test.com',
+        role='User',
+        created_at=datetime(2024, 3, 25, 12, 0, 0),
+        updated_at=datetime(2024, 3, 25, 12, 0, 0),
+    )
+
+    response = LoginResponse(
+        message='Login successful!',
+        token='token',
+        refresh_token='refresh',
+        user=user,
+    )
+
+    assert response.user == UserResponse.model_validate(user.to_dict())
+    assert response.model_dump(mode='json')['user'] == {
+        'id': str(user_id),
+        'full_name': 'User Test',
+        'email': 'user@test.com',
+        'role': 'User',
+        'created_at': '2024-03-25T12:00:00',
+        'updated_at': '2024-03-25T12:00:00',
+    }